@@ -60,6 +60,8 @@ DEFAULT_CONFIG = {
         "max_position_ratio": 0.9,
         "min_position_ratio": 0.1,
         "risk_check_interval": 300,
+        "persistence_kappa": 2,
+        "hysteresis_lo": 0.8,
     },
     "web": {
         "enabled": True,
@@ -104,12 +106,30 @@ MAX_LEVERAGE = 125
 MIN_LEVERAGE = 1
 MAX_POSITION_RATIO = 1.0
 MIN_POSITION_RATIO = 0.0
+ALERT_DEDUP_WINDOW_CHECKS = 3  # risk checks a repeat may lag its last sighting
+ALERT_DEDUP_CAPACITY = 256
+ALERT_REPEAT_SUMMARY_EVERY = 10
+ACTIVE_ALERT_CAPACITY = 256
+ACTIVE_ALERT_TTL = 3600  # seconds
+EMERGENCY_STOP_COOLDOWN = 30  # seconds between cancel-all requests
 
 # Grid trading constants
 MIN_GRID_SIZE = 0.1
 MAX_GRID_SIZE = 10.0
 DEFAULT_VOLATILITY_WINDOW = 24
 
+# HTTP connection pool constants
+HTTP_POOL_LIMIT = 20
+HTTP_DNS_CACHE_TTL = 300  # seconds
+HTTP_KEEPALIVE_TIMEOUT = 75  # seconds
+
+# Web dashboard constants
+WEB_STATUS_CACHE_TTL = 1.0  # seconds
+WEB_ANALYTICS_CACHE_TTL = 5.0  # seconds
+WEB_COMPRESS_MIN_BYTES = 1024  # smaller JSON bodies are sent uncompressed
+WEB_PUSH_INTERVAL = 1.0  # seconds between WebSocket dashboard updates
+WEB_API_CACHE_CONTROL = "private, max-age=1, stale-while-revalidate=4"
+
 # Notification constants
 MAX_MESSAGE_LENGTH = 4096  # Telegram message limit
 NOTIFICATION_RETRY_ATTEMPTS = 3
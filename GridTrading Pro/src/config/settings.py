@@ -65,6 +65,8 @@ class RiskSettings(BaseModel):
     max_position_ratio: float = Field(default=0.9, ge=0, le=1.0)
     min_position_ratio: float = Field(default=0.1, ge=0, le=1.0)
     risk_check_interval: int = Field(default=300, gt=0)
+    persistence_kappa: int = Field(default=2, ge=1)
+    hysteresis_lo: float = Field(default=0.8, gt=0, le=1.0)
 
     @model_validator(mode='after')
     def validate_position_ratios(self):
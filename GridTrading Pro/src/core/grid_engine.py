@@ -6,19 +6,22 @@ position management, and integration with multiple exchanges and strategies.
 """
 
 import asyncio
+import logging
 import time
 import math
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 
+import numpy as np
+
 from ..config.settings import Settings
 from ..exchanges.base_exchange import BaseExchange
 from ..notifications.base_notifier import BaseNotifier
 from ..utils.logger import get_logger
 from ..utils.helpers import (
     calculate_volatility, calculate_grid_levels, format_timestamp,
-    calculate_percentage_change, adjust_precision, safe_divide
+    calculate_percentage_change, adjust_precision, safe_divide, dumps_json
 )
 from ..data.data_manager import DataManager
 from .strategy_manager import StrategyManager
@@ -74,6 +77,7 @@ class GridEngine:
         self.last_trade_time = 0
         self.last_trade_price = 0.0
         self.trade_count = 0
+        self.saved_trade_count = 0  # Bumped only after a trade is persisted
         self.last_failed_attempts = {}  # Dict[price_level: timestamp]
         self.failed_order_cooldown = 300  # 5 minutes cooldown after failed order
         
@@ -82,6 +86,9 @@ class GridEngine:
         self.max_drawdown = 0.0
         self.peak_value = 0.0
         
+        # Encoded get_status() output, republished when state changes
+        self.status_snapshot: Optional[bytes] = None
+        
         self.logger.info(f"Grid engine initialized for {self.symbol}")
     
     async def initialize(self) -> bool:
@@ -126,6 +133,7 @@ class GridEngine:
             return
         
         self.is_running = True
+        self._publish_status()
         self.logger.info("Starting grid trading engine...")
         
         if self.notifier:
@@ -142,11 +150,13 @@ class GridEngine:
             await self._handle_error(e)
         finally:
             self.is_running = False
+            self._publish_status()
     
     async def stop(self) -> None:
         """Stop the grid trading engine."""
         self.logger.info("Stopping grid trading engine...")
         self.is_running = False
+        self._publish_status()
         
         # Cancel all open orders
         await self._cancel_all_orders()
@@ -187,6 +197,9 @@ class GridEngine:
                 # Update position management
                 await self.position_manager.update_positions()
                 
+                # Publish status for the web dashboard
+                self._publish_status()
+                
                 # Save state periodically
                 if time.time() - self.data_manager.last_save_time > self.settings.data.save_interval:
                     await self._save_state()
@@ -543,6 +556,8 @@ class GridEngine:
             else:
                 profit = 0  # Buy orders don't generate immediate profit
 
+            self._publish_status()
+
             # Log trade
             self.logger.info(
                 f"Grid {side} order filled: {amount:.6f} @ {price:.4f} "
@@ -562,6 +577,7 @@ class GridEngine:
                 'order_id': order['id'],
                 'grid_level': level
             })
+            self.saved_trade_count += 1
 
             # Send notification
             if self.notifier:
@@ -711,67 +727,71 @@ class GridEngine:
             'grid_levels_occupied': sum(1 for level in self.grid_levels.values() if level['occupied'])
         }
 
+    def _publish_status(self) -> None:
+        """Encode current status once so readers can serve it without rebuilding."""
+        try:
+            self.status_snapshot = dumps_json(self.get_status())
+        except Exception as e:
+            self.logger.error(f"Failed to publish status: {str(e)}")
+
     def _log_grid_levels(self) -> None:
         """Log detailed grid levels for debugging."""
+        # Skip all formatting work unless debug output is enabled
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
         try:
             base_price = self.grid_state.base_price
             current_price = self.grid_state.current_price
             grid_size = self.grid_state.grid_size
 
             # Calculate multiple grid levels (5 levels up and down)
-            levels = []
             grid_decimal = grid_size / 100
-
-            # Calculate grid levels
-            for i in range(-5, 6):  # -5 to +5 levels
+            indices = np.arange(-5, 6)
+            prices = base_price * (1 + indices * grid_decimal)
+
+            # Calculate distance from current price
+            with np.errstate(divide='ignore', invalid='ignore'):
+                distances = (prices - current_price) / current_price * 100
+
+            lines = [
+                "=" * 80,
+                f"GRID DEBUG INFO - {self.symbol}",
+                "=" * 80,
+                f"Base Price:    {base_price:.4f} USDT",
+                f"Current Price: {current_price:.4f} USDT",
+                f"Grid Size:     {grid_size:.2f}%",
+                f"Upper Band:    {self.grid_state.upper_band:.4f} USDT",
+                f"Lower Band:    {self.grid_state.lower_band:.4f} USDT",
+                "-" * 80,
+                "GRID LEVELS:",
+                "-" * 80
+            ]
+
+            for i, level_price, distance_pct in zip(indices.tolist(), prices.tolist(), distances.tolist()):
                 if i == 0:
-                    level_price = base_price
                     level_type = "BASE"
+                    status = " ← BASE"
                 else:
-                    level_price = base_price * (1 + (i * grid_decimal))
                     level_type = "SELL" if i > 0 else "BUY"
-
-                # Calculate distance from current price
-                distance_pct = ((level_price - current_price) / current_price) * 100
-
-                levels.append({
-                    'level': i,
-                    'type': level_type,
-                    'price': level_price,
-                    'distance_pct': distance_pct
-                })
-
-            # Log grid information
-            self.logger.debug("=" * 80)
-            self.logger.debug(f"GRID DEBUG INFO - {self.symbol}")
-            self.logger.debug("=" * 80)
-            self.logger.debug(f"Base Price:    {base_price:.4f} USDT")
-            self.logger.debug(f"Current Price: {current_price:.4f} USDT")
-            self.logger.debug(f"Grid Size:     {grid_size:.2f}%")
-            self.logger.debug(f"Upper Band:    {self.grid_state.upper_band:.4f} USDT")
-            self.logger.debug(f"Lower Band:    {self.grid_state.lower_band:.4f} USDT")
-            self.logger.debug("-" * 80)
-            self.logger.debug("GRID LEVELS:")
-            self.logger.debug("-" * 80)
-
-            for level in levels:
-                status = ""
-                if level['type'] == 'BASE':
-                    status = " ← BASE"
-                elif abs(level['distance_pct']) < 0.1:
-                    status = " ← CURRENT"
-                elif level['type'] == 'BUY' and level['distance_pct'] < 0:
-                    status = " ← BUY ZONE"
-                elif level['type'] == 'SELL' and level['distance_pct'] > 0:
-                    status = " ← SELL ZONE"
-
-                self.logger.debug(
-                    f"Level {level['level']:+2d} | {level['type']:4s} | "
-                    f"{level['price']:10.4f} USDT | "
-                    f"{level['distance_pct']:+6.2f}%{status}"
+                    status = ""
+                    if abs(distance_pct) < 0.1:
+                        status = " ← CURRENT"
+                    elif level_type == 'BUY' and distance_pct < 0:
+                        status = " ← BUY ZONE"
+                    elif level_type == 'SELL' and distance_pct > 0:
+                        status = " ← SELL ZONE"
+
+                lines.append(
+                    f"Level {i:+2d} | {level_type:4s} | "
+                    f"{level_price:10.4f} USDT | "
+                    f"{distance_pct:+6.2f}%{status}"
                 )
 
-            self.logger.debug("=" * 80)
+            lines.append("=" * 80)
+
+            # Emit the whole block through a single logging call
+            self.logger.debug("\n".join(lines))
 
         except Exception as e:
             self.logger.error(f"Failed to log grid levels: {str(e)}")
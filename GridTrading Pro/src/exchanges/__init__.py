@@ -5,12 +5,13 @@ This module provides unified interfaces for different exchanges and trading mode
 currently supporting Binance Spot and USDT-M Futures trading.
 """
 
-from .base_exchange import BaseExchange
+from .base_exchange import BaseExchange, PortfolioSnapshot
 from .binance_spot import BinanceSpotExchange
 from .binance_futures import BinanceFuturesExchange
 
 __all__ = [
     "BaseExchange",
+    "PortfolioSnapshot",
     "BinanceSpotExchange", 
     "BinanceFuturesExchange",
 ]
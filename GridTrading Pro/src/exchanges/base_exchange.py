@@ -7,13 +7,32 @@ providing a unified interface for trading operations across different exchanges.
 
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any, Union
+from dataclasses import dataclass
 import asyncio
 import time
 from decimal import Decimal
 
+import aiohttp
+
 from ..utils.logger import get_logger
 from ..utils.validators import validate_order_response, validate_balance_response
-from ..config.constants import OrderSide, OrderType
+from ..utils.helpers import safe_divide
+from ..config.constants import (
+    OrderSide, OrderType, HTTP_POOL_LIMIT, HTTP_DNS_CACHE_TTL, HTTP_KEEPALIVE_TIMEOUT
+)
+
+
+@dataclass
+class PortfolioSnapshot:
+    """Point-in-time balance and position view for one symbol."""
+    symbol: str
+    fetched_at: float  # time.monotonic() when fetched
+    balance: Dict[str, Any]
+    ticker: Optional[Dict[str, Any]]
+    position: Optional[Dict[str, Any]]
+    position_value: float
+    total_balance: float
+    position_ratio: float
 
 
 class BaseExchange(ABC):
@@ -43,6 +62,13 @@ class BaseExchange(ABC):
         self.last_request_time = 0
         self.min_request_interval = 0.1  # 100ms between requests
         
+        # Connector of the keep-alive session installed by ensure_session()
+        self._http_connector: Optional[aiohttp.TCPConnector] = None
+        
+        # Shared portfolio snapshots and in-flight fetches, per symbol
+        self._portfolio_snapshots: Dict[str, PortfolioSnapshot] = {}
+        self._portfolio_snapshot_tasks: Dict[str, asyncio.Future] = {}
+        
     @abstractmethod
     async def initialize(self) -> bool:
         """Initialize exchange connection and load market data."""
@@ -108,6 +134,55 @@ class BaseExchange(ABC):
         """Set leverage for symbol (futures only)."""
         pass
     
+    async def ensure_session(self) -> None:
+        """Attach a shared keep-alive HTTP session to the exchange client.
+
+        Repeated polls (balance, ticker, account value) then reuse pooled
+        TCP/TLS connections instead of handshaking on every request. Call
+        this before the first request (subclasses do so in ``initialize()``).
+        The session is owned by the exchange client and closed in ``close()``.
+        """
+        if self.exchange is None or not hasattr(self.exchange, 'session'):
+            return
+        
+        # A session passed in by the caller is left alone
+        if not getattr(self.exchange, 'own_session', True):
+            return
+        
+        session = self.exchange.session
+        if (
+            session is not None
+            and not session.closed
+            and self._http_connector is not None
+            and getattr(self.exchange, 'tcp_connector', None) is self._http_connector
+        ):
+            return
+        
+        # Let ccxt bind its event loop and build its SSL context, which honours
+        # the client's 'verify' and 'cafile' settings, then swap in the tuned pool
+        if hasattr(self.exchange, 'open'):
+            self.exchange.open()
+        if self.exchange.session is not None and not self.exchange.session.closed:
+            await self.exchange.session.close()
+        
+        connector_kwargs = {
+            'limit': HTTP_POOL_LIMIT,
+            'ttl_dns_cache': HTTP_DNS_CACHE_TTL,
+            'keepalive_timeout': HTTP_KEEPALIVE_TIMEOUT,
+            'enable_cleanup_closed': True,
+        }
+        ssl_context = getattr(self.exchange, 'ssl_context', None)
+        if ssl_context is not None:
+            connector_kwargs['ssl'] = ssl_context
+        
+        self._http_connector = aiohttp.TCPConnector(**connector_kwargs)
+        self.exchange.tcp_connector = self._http_connector
+        self.exchange.session = aiohttp.ClientSession(
+            connector=self._http_connector,
+            trust_env=getattr(self.exchange, 'aiohttp_trust_env', False)
+        )
+        self.logger.debug("Shared keep-alive HTTP session created")
+    
     async def _rate_limit(self):
         """Apply rate limiting between requests."""
         current_time = time.time()
@@ -253,7 +328,7 @@ class BaseExchange(ABC):
         balance = await self.get_balance()
         total_value = 0.0
         
-        for asset, amounts in balance.get('total', {}).items():
+        for asset, amounts in (balance.get('total') or {}).items():
             if asset == 'USDT':
                 total_value += float(amounts)
             else:
@@ -268,6 +343,62 @@ class BaseExchange(ABC):
         
         return total_value
     
+    async def get_portfolio_snapshot(self, symbol: str, ttl: float = 1.5) -> PortfolioSnapshot:
+        """Get a shared portfolio snapshot for symbol.
+        
+        Snapshots younger than ttl seconds are reused, and concurrent callers
+        share a single in-flight fetch, so consumers polling on a similar
+        cadence (risk manager, strategies) do not duplicate exchange calls.
+        """
+        snapshot = self._portfolio_snapshots.get(symbol)
+        if snapshot is not None and time.monotonic() - snapshot.fetched_at < ttl:
+            return snapshot
+        
+        task = self._portfolio_snapshot_tasks.get(symbol)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_portfolio_snapshot(symbol))
+            self._portfolio_snapshot_tasks[symbol] = task
+            task.add_done_callback(lambda _: self._portfolio_snapshot_tasks.pop(symbol, None))
+        
+        return await asyncio.shield(task)
+    
+    async def _fetch_portfolio_snapshot(self, symbol: str) -> PortfolioSnapshot:
+        """Fetch balance and position data and compute the position ratio."""
+        balance = await self.get_balance()
+        totals = balance.get('total') or {}
+        ticker = None
+        position = None
+        
+        if self.is_futures_mode():
+            # Futures position
+            position = await self.get_position(symbol)
+            position_value = abs(float(position.get('notional', 0)))
+            total_balance = float(totals.get('USDT', 0) or 0)
+        else:
+            # Spot position
+            base_asset = symbol.split('/')[0]
+            base_balance = float(totals.get(base_asset, 0) or 0)
+            usdt_balance = float(totals.get('USDT', 0) or 0)
+            
+            ticker = await self.get_ticker(symbol)
+            current_price = float(ticker['last'])
+            
+            position_value = base_balance * current_price
+            total_balance = position_value + usdt_balance
+        
+        snapshot = PortfolioSnapshot(
+            symbol=symbol,
+            fetched_at=time.monotonic(),
+            balance=balance,
+            ticker=ticker,
+            position=position,
+            position_value=position_value,
+            total_balance=total_balance,
+            position_ratio=safe_divide(position_value, total_balance)
+        )
+        self._portfolio_snapshots[symbol] = snapshot
+        return snapshot
+    
     def is_futures_mode(self) -> bool:
         """Check if exchange is in futures mode."""
         return False  # Override in futures implementation
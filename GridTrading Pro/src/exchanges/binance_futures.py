@@ -69,6 +69,9 @@ class BinanceFuturesExchange(BaseExchange):
         try:
             self.logger.info("Initializing Binance Futures exchange...")
             
+            # Install the keep-alive session before ccxt opens its own
+            await self.ensure_session()
+            
             # Load markets
             await self.exchange.load_markets()
             
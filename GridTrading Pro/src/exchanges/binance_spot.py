@@ -70,6 +70,9 @@ class BinanceSpotExchange(BaseExchange):
         try:
             self.logger.info("Initializing Binance Spot exchange...")
             
+            # Install the keep-alive session before ccxt opens its own
+            await self.ensure_session()
+            
             # Load markets
             await self.exchange.load_markets()
             
@@ -26,6 +26,9 @@ class NotificationPriority(Enum):
 class BaseNotifier(ABC):
     """Abstract base class for notification implementations."""
     
+    # Set by notifiers whose notify_risk_alerts_bulk sends one combined message
+    supports_bulk_alerts = False
+    
     def __init__(
         self,
         enabled: bool = True,
@@ -149,6 +152,41 @@ class BaseNotifier(ABC):
         
         return await self.send_message(message, priority)
     
+    async def notify_risk_alerts_bulk(self, alerts: List[Any]) -> bool:
+        """Send several risk alerts as a single notification.
+        
+        Each alert must provide alert_type, current_value, threshold and
+        action_required attributes.
+        """
+        if not alerts or not self.should_notify("risk"):
+            return False
+        
+        if len(alerts) == 1:
+            alert = alerts[0]
+            return await self.notify_risk_alert(
+                alert.alert_type,
+                alert.current_value,
+                alert.threshold,
+                "EMERGENCY_STOP" if alert.action_required else "MONITOR"
+            )
+        
+        action_required = any(alert.action_required for alert in alerts)
+        priority = NotificationPriority.HIGH if action_required else NotificationPriority.NORMAL
+        
+        lines = [
+            f"⚠️ RISK ALERTS ({len(alerts)})",
+            "━━━━━━━━━━━━━━━━━━━━"
+        ]
+        for alert in alerts:
+            action = "EMERGENCY_STOP" if alert.action_required else "MONITOR"
+            lines.append(
+                f"🔍 {alert.alert_type} | 📊 {alert.current_value:.4f} | "
+                f"🎯 {alert.threshold:.4f} | 🎬 {action}"
+            )
+        lines.append(f"⏰ Time: {time.strftime('%H:%M:%S')}")
+        
+        return await self.send_message("\n".join(lines), priority)
+    
     async def notify_system_status(
         self,
         status: str,
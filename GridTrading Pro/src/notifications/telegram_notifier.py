@@ -21,6 +21,8 @@ from ..config.constants import MAX_MESSAGE_LENGTH, NOTIFICATION_RETRY_ATTEMPTS
 class TelegramNotifier(BaseNotifier):
     """Telegram notification implementation."""
     
+    supports_bulk_alerts = True
+    
     def __init__(
         self,
         bot_token: str,
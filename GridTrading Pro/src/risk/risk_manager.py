@@ -5,18 +5,30 @@ This module implements comprehensive risk management including position limits,
 drawdown protection, daily loss limits, and emergency stop mechanisms.
 """
 
+import asyncio
+import sys
 import time
-from typing import Dict, List, Optional, Any, Tuple
+import dataclasses
+from collections import OrderedDict, defaultdict, deque
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
 from ..config.settings import Settings
+from ..config.constants import (
+    ALERT_DEDUP_WINDOW_CHECKS, ALERT_DEDUP_CAPACITY, ALERT_REPEAT_SUMMARY_EVERY,
+    ACTIVE_ALERT_CAPACITY, ACTIVE_ALERT_TTL, EMERGENCY_STOP_COOLDOWN
+)
 from ..exchanges.base_exchange import BaseExchange
 from ..notifications.base_notifier import BaseNotifier
 from ..utils.logger import get_logger
-from ..utils.helpers import safe_divide
+from ..utils.batcher import AsyncBatcher
 
 
-@dataclass
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class RiskAlert:
     """Risk alert data structure."""
     alert_type: str
@@ -43,10 +55,39 @@ class RiskManager:
         self.notifier = notifier
         self.logger = get_logger("RiskManager")
         
+        # Log method per alert severity
+        self._log_dispatch = {
+            'low': self.logger.info,
+            'medium': self.logger.warning,
+            'high': self.logger.warning,
+            'critical': self.logger.error,
+        }
+        
         # Risk tracking
-        self.active_alerts: List[RiskAlert] = []
-        self.risk_history: List[RiskAlert] = []
+        self.active_alerts: Deque[RiskAlert] = deque(maxlen=ACTIVE_ALERT_CAPACITY)
+        self.risk_history: Deque[RiskAlert] = deque(maxlen=100)  # Keep last 100
         self.emergency_stop_triggered = False
+        self._last_emergency_mono: Optional[float] = None
+        
+        # Alert deduplication: key -> [last_seen, repeat_count]
+        self._alert_dedup: OrderedDict = OrderedDict()
+        
+        # Notifications from one risk check are delivered as a single batch
+        self._notify_batcher = AsyncBatcher(
+            self._send_alert_batch,
+            max_batch_size=10,
+            max_queue_time=0.5
+        )
+        
+        # Consecutive breach counters per alert type
+        self._run_lengths: Dict[str, int] = defaultdict(int)
+        self.persistence_kappa = settings.risk.persistence_kappa
+        self.hysteresis_lo = settings.risk.hysteresis_lo
+        
+        # Emergency limits, normalised so that a breach means value > limit
+        self._emergency_drawdown = -settings.risk.max_drawdown * 2
+        self._emergency_daily = -settings.risk.daily_loss_limit * 2
+        self._emergency_pos = 0.95
         
         # Performance tracking
         self.peak_portfolio_value = 0
@@ -55,9 +96,19 @@ class RiskManager:
         self.daily_pnl = 0
         self.last_daily_reset = 0
         
-        # Check intervals
+        # Check intervals (backed off while the portfolio is far from all limits).
+        # Interval gating uses the monotonic clock; last_risk_check is wall time.
+        # Worst-case emergency-stop latency after a sudden breach is
+        # (healthy_backoff_factor + persistence_kappa - 1) * base interval,
+        # e.g. (4 + 2 - 1) * 300s = 25 minutes at default settings.
         self.last_risk_check = 0
-        self.risk_check_interval = settings.risk.risk_check_interval
+        self._last_risk_check_mono: Optional[float] = None
+        self.base_risk_check_interval = settings.risk.risk_check_interval
+        self.risk_check_interval = self.base_risk_check_interval
+        self.healthy_backoff_factor = 4
+        
+        # Repeats stay suppressed while seen again within a few check intervals
+        self._alert_dedup_window = self.base_risk_check_interval * ALERT_DEDUP_WINDOW_CHECKS
         
         # Position tracking
         self.current_position_ratio = 0
@@ -68,11 +119,14 @@ class RiskManager:
         try:
             self.logger.info("Initializing risk manager...")
             
+            # Reuse the exchange's keep-alive session for all risk polls (no-op once installed)
+            await self.exchange.ensure_session()
+            
             # Get initial portfolio value
             account_value = await self.exchange.get_account_value()
             self.peak_portfolio_value = account_value
             self.daily_start_value = account_value
-            self.last_daily_reset = time.time()
+            self.last_daily_reset = time.monotonic()
             
             self.logger.info(f"Risk manager initialized - Initial value: {account_value:.2f} USDT")
             return True
@@ -84,9 +138,13 @@ class RiskManager:
     async def check_all_risks(self) -> List[RiskAlert]:
         """Perform comprehensive risk check."""
         current_time = time.time()
+        current_mono = time.monotonic()
         
         # Check if risk check is needed
-        if current_time - self.last_risk_check < self.risk_check_interval:
+        if (
+            self._last_risk_check_mono is not None
+            and current_mono - self._last_risk_check_mono < self.risk_check_interval
+        ):
             return []
         
         alerts = []
@@ -115,6 +173,14 @@ class RiskManager:
             await self._process_alerts(alerts)
             
             self.last_risk_check = current_time
+            self._last_risk_check_mono = current_mono
+            
+            # Poll less often while healthy; return to base rate as soon as any
+            # breach (even one not yet persistent enough to alert) is being tracked
+            if not alerts and not any(self._run_lengths.values()) and self._is_well_within_limits():
+                self.risk_check_interval = self.base_risk_check_interval * self.healthy_backoff_factor
+            else:
+                self.risk_check_interval = self.base_risk_check_interval
             
         except Exception as e:
             self.logger.error(f"Risk check failed: {str(e)}")
@@ -133,6 +199,15 @@ class RiskManager:
         
         return alerts
     
+    def _is_well_within_limits(self) -> bool:
+        """Check if all metrics are within half of their nearest limit."""
+        risk = self.settings.risk
+        return (
+            self.current_position_ratio < 0.5 * risk.max_position_ratio
+            and self.current_drawdown > 0.5 * risk.max_drawdown
+            and self.daily_pnl > 0.5 * risk.daily_loss_limit
+        )
+    
     async def _update_portfolio_metrics(self) -> None:
         """Update portfolio performance metrics."""
         try:
@@ -151,10 +226,10 @@ class RiskManager:
                 self.daily_pnl = (current_value - self.daily_start_value) / self.daily_start_value
             
             # Check for daily reset
-            if time.time() - self.last_daily_reset > 86400:  # 24 hours
+            if time.monotonic() - self.last_daily_reset > 86400:  # 24 hours
                 self.daily_start_value = current_value
                 self.daily_pnl = 0
-                self.last_daily_reset = time.time()
+                self.last_daily_reset = time.monotonic()
                 self.logger.info("Daily metrics reset")
             
         except Exception as e:
@@ -166,28 +241,9 @@ class RiskManager:
         alerts = []
         
         try:
-            # Get current position ratio
-            balance = await self.exchange.get_balance()
-            symbol = self.settings.trading.symbol
-            
-            if self.exchange.is_futures_mode():
-                # Futures position
-                position = await self.exchange.get_position(symbol)
-                position_value = abs(float(position.get('notional', 0)))
-                total_balance = float(balance.get('total', {}).get('USDT', 0))
-            else:
-                # Spot position
-                base_asset = symbol.split('/')[0]
-                base_balance = float(balance.get('total', {}).get(base_asset, 0))
-                usdt_balance = float(balance.get('total', {}).get('USDT', 0))
-                
-                ticker = await self.exchange.get_ticker(symbol)
-                current_price = float(ticker['last'])
-                
-                position_value = base_balance * current_price
-                total_balance = position_value + usdt_balance
-            
-            self.current_position_ratio = safe_divide(position_value, total_balance)
+            # Get current position ratio (shared with strategies)
+            snapshot = await self.exchange.get_portfolio_snapshot(self.settings.trading.symbol)
+            self.current_position_ratio = snapshot.position_ratio
             
             # Check maximum position ratio
             if self.current_position_ratio > self.settings.risk.max_position_ratio:
@@ -223,8 +279,9 @@ class RiskManager:
         alerts = []
         
         try:
-            # Check maximum drawdown
-            if self.current_drawdown < self.settings.risk.max_drawdown:
+            # Check maximum drawdown (must persist for kappa checks)
+            breached = self.current_drawdown < self.settings.risk.max_drawdown
+            if self._update_run_length("MAX_DRAWDOWN_EXCEEDED", breached) >= self.persistence_kappa:
                 severity = "critical" if self.current_drawdown < self.settings.risk.max_drawdown * 1.5 else "high"
                 
                 alerts.append(RiskAlert(
@@ -247,8 +304,9 @@ class RiskManager:
         alerts = []
         
         try:
-            # Check daily loss limit
-            if self.daily_pnl < self.settings.risk.daily_loss_limit:
+            # Check daily loss limit (must persist for kappa checks)
+            breached = self.daily_pnl < self.settings.risk.daily_loss_limit
+            if self._update_run_length("DAILY_LOSS_LIMIT_EXCEEDED", breached) >= self.persistence_kappa:
                 severity = "critical" if self.daily_pnl < self.settings.risk.daily_loss_limit * 1.5 else "high"
                 
                 alerts.append(RiskAlert(
@@ -272,60 +330,162 @@ class RiskManager:
         
         try:
             # Check for extreme conditions that require immediate action
-            emergency_conditions = [
-                (self.current_drawdown < self.settings.risk.max_drawdown * 2, "EXTREME_DRAWDOWN"),
-                (self.daily_pnl < self.settings.risk.daily_loss_limit * 2, "EXTREME_DAILY_LOSS"),
-                (self.current_position_ratio > 0.95, "EXTREME_POSITION_RATIO")
-            ]
-            
-            for condition, alert_type in emergency_conditions:
-                if condition:
-                    alerts.append(RiskAlert(
-                        alert_type=alert_type,
-                        severity="critical",
-                        message=f"Emergency condition detected: {alert_type}",
-                        current_value=0,
-                        threshold=0,
-                        timestamp=time.time(),
-                        action_required=True
-                    ))
-                    
-                    # Trigger emergency stop
-                    if not self.emergency_stop_triggered:
-                        await self._trigger_emergency_stop(alert_type)
+            kappa = self.persistence_kappa
+            alert_types = []
+            
+            run_length = self._update_emergency_run_length(
+                "EXTREME_DRAWDOWN", -self.current_drawdown, self._emergency_drawdown
+            )
+            if run_length >= kappa:
+                alert_types.append("EXTREME_DRAWDOWN")
+            
+            run_length = self._update_emergency_run_length(
+                "EXTREME_DAILY_LOSS", -self.daily_pnl, self._emergency_daily
+            )
+            if run_length >= kappa:
+                alert_types.append("EXTREME_DAILY_LOSS")
+            
+            run_length = self._update_emergency_run_length(
+                "EXTREME_POSITION_RATIO", self.current_position_ratio, self._emergency_pos
+            )
+            if run_length >= kappa:
+                alert_types.append("EXTREME_POSITION_RATIO")
+            
+            # Collapse simultaneous conditions into a single alert
+            if alert_types:
+                alerts.append(RiskAlert(
+                    alert_type="+".join(alert_types),
+                    severity="critical",
+                    message=f"Emergency condition detected: {', '.join(alert_types)}",
+                    current_value=0,
+                    threshold=0,
+                    timestamp=time.time(),
+                    action_required=True
+                ))
+                
+                # Every breach here has persisted for kappa checks, so stop now
+                if not self.emergency_stop_triggered:
+                    await self._trigger_emergency_stop(", ".join(alert_types))
             
         except Exception as e:
             self.logger.error(f"Failed to check emergency conditions: {str(e)}")
         
         return alerts
     
+    def _update_run_length(self, alert_type: str, breached: bool) -> int:
+        """Update and return the consecutive breach count for an alert type."""
+        if breached:
+            self._run_lengths[alert_type] += 1
+        else:
+            self._run_lengths[alert_type] = 0
+        return self._run_lengths[alert_type]
+    
+    def _update_emergency_run_length(self, alert_type: str, value: float, limit: float) -> int:
+        """Update an emergency breach count with hysteresis.
+        
+        The count grows while value exceeds limit and is only reset once value
+        falls back below limit * hysteresis_lo, so readings hovering around
+        the limit neither re-arm nor clear the emergency state.
+        """
+        if value > limit:
+            self._run_lengths[alert_type] += 1
+        elif value < limit * self.hysteresis_lo:
+            self._run_lengths[alert_type] = 0
+        return self._run_lengths[alert_type]
+    
     async def _process_alerts(self, alerts: List[RiskAlert]) -> None:
         """Process and handle risk alerts."""
+        current_time = time.time()
+        notifications = []
+        
+        # Expire stale active alerts
+        while self.active_alerts and current_time - self.active_alerts[0].timestamp > ACTIVE_ALERT_TTL:
+            self.active_alerts.popleft()
+        
         for alert in alerts:
             # Add to active alerts
             self.active_alerts.append(alert)
             self.risk_history.append(alert)
             
+            # Suppress repeats of a recent identical alert, summarising every Nth
+            repeat_count = self._register_alert(alert, current_time)
+            if repeat_count and repeat_count % ALERT_REPEAT_SUMMARY_EVERY:
+                continue
+            
+            if repeat_count:
+                alert = dataclasses.replace(
+                    alert,
+                    alert_type=f"{alert.alert_type} (repeated {repeat_count} times)",
+                    message=f"{alert.message} (repeated {repeat_count} times)"
+                )
+            
             # Log alert
-            log_method = getattr(self.logger, alert.severity if alert.severity != 'critical' else 'error')
-            log_method(f"RISK ALERT: {alert.message}")
+            self._log_dispatch.get(alert.severity, self.logger.info)(f"RISK ALERT: {alert.message}")
             
-            # Send notification
+            # Queue notification
             if self.notifier:
-                await self.notifier.notify_risk_alert(
-                    alert.alert_type,
-                    alert.current_value,
-                    alert.threshold,
-                    "EMERGENCY_STOP" if alert.action_required else "MONITOR"
-                )
+                notifications.append(self._notify_batcher.submit(alert))
+        
+        # Wait for the batcher's size/time triggers to deliver queued notifications
+        if notifications:
+            results = await asyncio.gather(*notifications, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error(f"Failed to send risk alert notifications: {str(result)}")
+                    break
+    
+    async def _send_alert_batch(self, alerts: List[RiskAlert]) -> bool:
+        """Send a batch of risk alerts through the notifier."""
+        if getattr(self.notifier, 'supports_bulk_alerts', False):
+            return await self.notifier.notify_risk_alerts_bulk(alerts)
+        
+        # No bulk API: send individual notifications concurrently
+        results = await asyncio.gather(*[
+            self.notifier.notify_risk_alert(
+                alert.alert_type,
+                alert.current_value,
+                alert.threshold,
+                "EMERGENCY_STOP" if alert.action_required else "MONITOR"
+            )
+            for alert in alerts
+        ], return_exceptions=True)
+        
+        for alert, result in zip(alerts, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to send risk alert {alert.alert_type}: {str(result)}")
+        
+        return all(result is True for result in results)
+    
+    def _register_alert(self, alert: RiskAlert, current_time: float) -> int:
+        """Record alert in the dedup window and return how often it repeated."""
+        key = (alert.alert_type, alert.severity, round(alert.current_value, 4))
+        entry = self._alert_dedup.get(key)
+        
+        if entry is not None and current_time - entry[0] < self._alert_dedup_window:
+            entry[0] = current_time
+            entry[1] += 1
+            self._alert_dedup.move_to_end(key)
+            return int(entry[1])
         
-        # Clean old alerts (keep last 100)
-        if len(self.risk_history) > 100:
-            self.risk_history = self.risk_history[-100:]
+        self._alert_dedup[key] = [current_time, 0]
+        self._alert_dedup.move_to_end(key)
+        while len(self._alert_dedup) > ALERT_DEDUP_CAPACITY:
+            self._alert_dedup.popitem(last=False)
+        return 0
     
     async def _trigger_emergency_stop(self, reason: str) -> None:
         """Trigger emergency stop."""
         try:
+            # Throttle cancel-all requests even if the stop flag was reset
+            current_mono = time.monotonic()
+            if (
+                self._last_emergency_mono is not None
+                and current_mono - self._last_emergency_mono < EMERGENCY_STOP_COOLDOWN
+            ):
+                self.logger.warning(f"Emergency stop throttled: {reason}")
+                return
+            self._last_emergency_mono = current_mono
+            
             self.emergency_stop_triggered = True
             
             self.logger.critical(f"EMERGENCY STOP TRIGGERED: {reason}")
@@ -367,8 +527,9 @@ class RiskManager:
     
     def get_active_alerts(self) -> List[RiskAlert]:
         """Get active risk alerts."""
-        return self.active_alerts.copy()
+        return list(self.active_alerts)
     
     async def close(self) -> None:
         """Close risk manager."""
+        await self._notify_batcher.flush()
         self.logger.info("Risk manager closed")
@@ -6,7 +6,10 @@ grid adjustment and position management.
 """
 
 import time
-from typing import Dict, Any, Optional
+import bisect
+import functools
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Sequence, Tuple
 
 from ..core.strategy_manager import BaseStrategy
 from ..config.settings import Settings
@@ -15,6 +18,18 @@ from ..notifications.base_notifier import BaseNotifier
 from ..utils.helpers import calculate_grid_levels, calculate_volatility
 
 
+@functools.lru_cache(maxsize=16)
+def _grid_levels_cached(
+    base_price: float,
+    grid_size: float
+) -> Tuple[Tuple[float, ...], Tuple[float, ...], Tuple[float, ...]]:
+    """Calculate (buy, sell, ascending buy) levels for a base price and grid size."""
+    grid_levels = calculate_grid_levels(base_price, grid_size, num_levels=10)
+    buy_levels = tuple(grid_levels['buy_levels'])
+    sell_levels = tuple(grid_levels['sell_levels'])
+    return buy_levels, sell_levels, buy_levels[::-1]
+
+
 class GridStrategy(BaseStrategy):
     """Grid trading strategy implementation."""
     
@@ -34,13 +49,26 @@ class GridStrategy(BaseStrategy):
         self.max_grid_size = settings.grid.max_size
         self.dynamic_adjustment = settings.grid.dynamic_adjustment
         
+        # Volatility thresholds sorted by lower edge for bisect lookup
+        thresholds = sorted(
+            settings.grid.volatility_thresholds,
+            key=lambda threshold: threshold['range'][0]
+        )
+        self._volatility_lows = [threshold['range'][0] for threshold in thresholds]
+        self._volatility_highs = [threshold['range'][1] for threshold in thresholds]
+        self._volatility_grid_sizes = [threshold['grid_size'] for threshold in thresholds]
+        self._grid_size_cache: OrderedDict = OrderedDict()
+        self._grid_size_cache_size = 32
+        
         # State tracking
         self.last_adjustment_time = 0
+        self._last_adjustment_mono: Optional[float] = None  # Monotonic clock for interval checks
         self.adjustment_interval = 3600  # 1 hour default
         
         # Grid levels
         self.buy_levels = []
         self.sell_levels = []
+        self._buy_levels_asc = []  # buy_levels in ascending price order for bisect
         self.active_orders = {}
     
     async def initialize(self) -> bool:
@@ -89,9 +117,13 @@ class GridStrategy(BaseStrategy):
         """Adjust grid size based on market volatility."""
         try:
             current_time = time.time()
+            current_mono = time.monotonic()
             
             # Check if adjustment is needed
-            if current_time - self.last_adjustment_time < self.adjustment_interval:
+            if (
+                self._last_adjustment_mono is not None
+                and current_mono - self._last_adjustment_mono < self.adjustment_interval
+            ):
                 return
             
             # Calculate new grid size based on volatility
@@ -103,6 +135,7 @@ class GridStrategy(BaseStrategy):
                 old_size = self.grid_size
                 self.grid_size = new_grid_size
                 self.last_adjustment_time = current_time
+                self._last_adjustment_mono = current_mono
                 
                 self.logger.info(
                     f"Grid size adjusted: {old_size:.1f}% → {new_grid_size:.1f}% "
@@ -122,21 +155,34 @@ class GridStrategy(BaseStrategy):
     
     def _get_optimal_grid_size(self, volatility: float) -> float:
         """Get optimal grid size based on volatility."""
-        # Use volatility thresholds from settings
-        for threshold in self.settings.grid.volatility_thresholds:
-            vol_range = threshold['range']
-            if vol_range[0] <= volatility < vol_range[1]:
-                return min(max(threshold['grid_size'], self.min_grid_size), self.max_grid_size)
+        key = round(volatility, 4)
+        cached = self._grid_size_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # Find the threshold whose range contains the volatility
+        grid_size = self.max_grid_size  # Default for very high volatility
+        index = bisect.bisect_right(self._volatility_lows, key) - 1
+        if index >= 0 and key < self._volatility_highs[index]:
+            grid_size = min(
+                max(self._volatility_grid_sizes[index], self.min_grid_size),
+                self.max_grid_size
+            )
+        
+        # Bounded FIFO cache
+        self._grid_size_cache[key] = grid_size
+        if len(self._grid_size_cache) > self._grid_size_cache_size:
+            self._grid_size_cache.popitem(last=False)
         
-        # Default to max grid size for very high volatility
-        return self.max_grid_size
+        return grid_size
     
     def _calculate_grid_levels(self, base_price: float) -> None:
         """Calculate grid buy and sell levels."""
         try:
-            grid_levels = calculate_grid_levels(base_price, self.grid_size, num_levels=10)
-            self.buy_levels = grid_levels['buy_levels']
-            self.sell_levels = grid_levels['sell_levels']
+            # Levels only change when base price or grid size move, so reuse them
+            self.buy_levels, self.sell_levels, self._buy_levels_asc = _grid_levels_cached(
+                float(base_price), float(self.grid_size)
+            )
             
         except Exception as e:
             self.logger.error(f"Failed to calculate grid levels: {str(e)}")
@@ -147,24 +193,29 @@ class GridStrategy(BaseStrategy):
             current_price = grid_state.current_price
             
             # Check buy signals (price near buy levels)
-            for i, buy_level in enumerate(self.buy_levels):
-                if abs(current_price - buy_level) / buy_level < 0.001:  # Within 0.1%
-                    return {
-                        'action': 'BUY',
-                        'price': buy_level,
-                        'level': i + 1,
-                        'reason': f'Price near buy level {i + 1}: {buy_level:.4f}'
-                    }
+            # buy_levels is scanned from the highest level down, so prefer the highest match
+            index = self._find_near_level(self._buy_levels_asc, current_price, highest=True)
+            if index is not None:
+                level = len(self._buy_levels_asc) - index
+                buy_level = self._buy_levels_asc[index]
+                return {
+                    'action': 'BUY',
+                    'price': buy_level,
+                    'level': level,
+                    'reason': f'Price near buy level {level}: {buy_level:.4f}'
+                }
             
             # Check sell signals (price near sell levels)
-            for i, sell_level in enumerate(self.sell_levels):
-                if abs(current_price - sell_level) / sell_level < 0.001:  # Within 0.1%
-                    return {
-                        'action': 'SELL',
-                        'price': sell_level,
-                        'level': i + 1,
-                        'reason': f'Price near sell level {i + 1}: {sell_level:.4f}'
-                    }
+            index = self._find_near_level(self.sell_levels, current_price, highest=False)
+            if index is not None:
+                level = index + 1
+                sell_level = self.sell_levels[index]
+                return {
+                    'action': 'SELL',
+                    'price': sell_level,
+                    'level': level,
+                    'reason': f'Price near sell level {level}: {sell_level:.4f}'
+                }
             
             return {'action': 'NONE', 'reason': 'No grid signals'}
             
@@ -172,12 +223,38 @@ class GridStrategy(BaseStrategy):
             self.logger.error(f"Failed to check trading signals: {str(e)}")
             return {'action': 'ERROR', 'error': str(e)}
     
+    @staticmethod
+    def _find_near_level(levels: Sequence[float], price: float, highest: bool) -> Optional[int]:
+        """Find the index of a level within 0.1% of price in an ascending list.
+        
+        Matching levels form a contiguous run around the insertion point; the
+        highest or lowest of them is returned, matching the order in which the
+        original linear scan visited the list.
+        """
+        def is_near(i: int) -> bool:
+            level = levels[i]
+            return abs(price - level) / level < 0.001  # Within 0.1%
+        
+        index = bisect.bisect_left(levels, price)
+        
+        # Extend the run downwards from index - 1 and upwards from index
+        low = index
+        while low > 0 and is_near(low - 1):
+            low -= 1
+        high = index - 1
+        while high + 1 < len(levels) and is_near(high + 1):
+            high += 1
+        
+        if low > high:
+            return None
+        return high if highest else low
+    
     def get_grid_info(self) -> Dict[str, Any]:
         """Get current grid information."""
         return {
             'grid_size': self.grid_size,
-            'buy_levels': self.buy_levels[:5],  # Show first 5 levels
-            'sell_levels': self.sell_levels[:5],
+            'buy_levels': list(self.buy_levels[:5]),  # Show first 5 levels
+            'sell_levels': list(self.sell_levels[:5]),
             'last_adjustment': self.last_adjustment_time,
             'dynamic_adjustment': self.dynamic_adjustment
         }
@@ -6,13 +6,16 @@ for position adjustment and rebalancing.
 """
 
 import time
+from collections import deque
 from typing import Dict, Any, Optional, List
 
+import numpy as np
+
 from ..core.strategy_manager import BaseStrategy
 from ..config.settings import Settings
 from ..exchanges.base_exchange import BaseExchange
 from ..notifications.base_notifier import BaseNotifier
-from ..utils.helpers import calculate_percentage_change, safe_divide
+from ..utils.helpers import calculate_percentage_change
 
 
 class S1Strategy(BaseStrategy):
@@ -37,11 +40,20 @@ class S1Strategy(BaseStrategy):
         self.daily_high = None
         self.daily_low = None
         self.last_data_update = 0
+        self._last_data_update_mono: Optional[float] = None  # Monotonic clock for interval checks
         self.daily_update_interval = 23.9 * 60 * 60  # ~24 hours
         
+        # Sliding-window high/low over completed daily klines.
+        # Monotonic deques of (day_index, value); the front is the extreme.
+        self._high_window: deque = deque()
+        self._low_window: deque = deque()
+        self._kline_count = 0
+        self._last_kline_time: Optional[float] = None
+        
         # Position tracking
         self.current_position_ratio = 0.0
         self.last_adjustment_time = 0
+        self._last_adjustment_mono: Optional[float] = None
         self.min_adjustment_interval = 300  # 5 minutes
     
     async def initialize(self) -> bool:
@@ -99,9 +111,10 @@ class S1Strategy(BaseStrategy):
     
     async def _check_and_update_levels(self) -> None:
         """Check if daily levels need updating."""
-        current_time = time.time()
-        
-        if current_time - self.last_data_update >= self.daily_update_interval:
+        if (
+            self._last_data_update_mono is None
+            or time.monotonic() - self._last_data_update_mono >= self.daily_update_interval
+        ):
             await self._update_daily_levels()
     
     async def _update_daily_levels(self) -> None:
@@ -109,32 +122,57 @@ class S1Strategy(BaseStrategy):
         try:
             self.logger.info("Updating S1 daily levels...")
             
+            # After the first bulk load only fetch the days missed since then
+            limit = self.lookback_days + 2
+            incremental = self._last_kline_time is not None
+            if incremental:
+                elapsed_days = int((time.time() * 1000 - self._last_kline_time) // 86400000)
+                if elapsed_days + 2 < limit:
+                    limit = elapsed_days + 2
+                else:
+                    incremental = False
+            
             # Get historical kline data
             symbol = self.settings.trading.symbol
             klines = await self.exchange.get_klines(
                 symbol=symbol,
                 interval='1d',
-                limit=self.lookback_days + 2
+                limit=limit
             )
             
-            if not klines or len(klines) < self.lookback_days + 1:
-                self.logger.warning(f"Insufficient kline data: {len(klines) if klines else 0}")
-                return
-            
-            # Use completed daily candles (exclude current incomplete day)
-            relevant_klines = klines[-(self.lookback_days + 1):-1]
-            
-            if len(relevant_klines) < self.lookback_days:
-                self.logger.warning(f"Not enough relevant klines: {len(relevant_klines)}")
-                return
-            
-            # Calculate high and low (index 2=high, 3=low)
-            highs = [float(kline[2]) for kline in relevant_klines]
-            lows = [float(kline[3]) for kline in relevant_klines]
-            
-            self.daily_high = max(highs)
-            self.daily_low = min(lows)
+            if incremental:
+                if not klines:
+                    self.logger.warning("No kline data returned")
+                    return
+                
+                # Use completed daily candles (exclude current incomplete day)
+                for kline in klines[:-1]:
+                    if float(kline[0]) > self._last_kline_time:
+                        self._push_daily_kline(float(kline[0]), float(kline[2]), float(kline[3]))
+            else:
+                if not klines or len(klines) < self.lookback_days + 1:
+                    self.logger.warning(f"Insufficient kline data: {len(klines) if klines else 0}")
+                    return
+                
+                # Use completed daily candles (exclude current incomplete day)
+                relevant_klines = klines[-(self.lookback_days + 1):-1]
+                
+                if len(relevant_klines) < self.lookback_days:
+                    self.logger.warning(f"Not enough relevant klines: {len(relevant_klines)}")
+                    return
+                
+                # Rebuild the windows (index 0=time, 2=high, 3=low)
+                kline_array = np.asarray(relevant_klines, dtype=np.float64)
+                self._high_window.clear()
+                self._low_window.clear()
+                self._kline_count = 0
+                for open_time, high, low in kline_array[:, [0, 2, 3]].tolist():
+                    self._push_daily_kline(open_time, high, low)
+            
+            self.daily_high = self._high_window[0][1]
+            self.daily_low = self._low_window[0][1]
             self.last_data_update = time.time()
+            self._last_data_update_mono = time.monotonic()
             
             self.logger.info(
                 f"S1 levels updated - High: {self.daily_high:.4f}, Low: {self.daily_low:.4f}"
@@ -143,36 +181,33 @@ class S1Strategy(BaseStrategy):
         except Exception as e:
             self.logger.error(f"Failed to update daily levels: {str(e)}")
     
+    def _push_daily_kline(self, open_time: float, high: float, low: float) -> None:
+        """Add a completed daily kline to the sliding high/low windows."""
+        index = self._kline_count
+        self._kline_count += 1
+        self._last_kline_time = open_time
+        
+        while self._high_window and self._high_window[-1][1] <= high:
+            self._high_window.pop()
+        self._high_window.append((index, high))
+        
+        while self._low_window and self._low_window[-1][1] >= low:
+            self._low_window.pop()
+        self._low_window.append((index, low))
+        
+        # Drop days that have left the lookback window
+        oldest = index - self.lookback_days
+        while self._high_window[0][0] <= oldest:
+            self._high_window.popleft()
+        while self._low_window[0][0] <= oldest:
+            self._low_window.popleft()
+    
     async def _update_position_ratio(self) -> None:
         """Update current position ratio."""
         try:
-            # Get account balance
-            balance = await self.exchange.get_balance()
-            
-            # Calculate position value and total assets
-            if self.exchange.is_futures_mode():
-                # Futures position
-                symbol = self.settings.trading.symbol
-                position = await self.exchange.get_position(symbol)
-                position_value = abs(float(position.get('notional', 0)))
-                total_balance = float(balance.get('total', {}).get('USDT', 0))
-                
-            else:
-                # Spot position
-                symbol = self.settings.trading.symbol
-                base_asset = symbol.split('/')[0]
-                base_balance = float(balance.get('total', {}).get(base_asset, 0))
-                usdt_balance = float(balance.get('total', {}).get('USDT', 0))
-                
-                # Get current price
-                ticker = await self.exchange.get_ticker(symbol)
-                current_price = float(ticker['last'])
-                
-                position_value = base_balance * current_price
-                total_balance = position_value + usdt_balance
-            
-            # Calculate position ratio
-            self.current_position_ratio = safe_divide(position_value, total_balance)
+            # Shared snapshot, so risk checks on a similar cadence reuse it
+            snapshot = await self.exchange.get_portfolio_snapshot(self.settings.trading.symbol)
+            self.current_position_ratio = snapshot.position_ratio
             
         except Exception as e:
             self.logger.error(f"Failed to update position ratio: {str(e)}")
@@ -180,10 +215,11 @@ class S1Strategy(BaseStrategy):
     async def _check_s1_signals(self, current_price: float) -> Dict[str, Any]:
         """Check for S1 trading signals."""
         try:
-            current_time = time.time()
-            
             # Check minimum interval between adjustments
-            if current_time - self.last_adjustment_time < self.min_adjustment_interval:
+            if (
+                self._last_adjustment_mono is not None
+                and time.monotonic() - self._last_adjustment_mono < self.min_adjustment_interval
+            ):
                 return {'action': 'NONE', 'reason': 'Too soon for adjustment'}
             
             # Check high breakout (sell signal)
@@ -240,7 +276,8 @@ class S1Strategy(BaseStrategy):
             balance = await self.exchange.get_balance()
             
             if self.exchange.is_futures_mode():
-                total_balance = float(balance.get('total', {}).get('USDT', 0))
+                totals = balance.get('total') or {}
+                total_balance = float(totals.get('USDT', 0) or 0)
             else:
                 # For spot, calculate total portfolio value
                 total_balance = await self.exchange.get_account_value()
@@ -264,6 +301,7 @@ class S1Strategy(BaseStrategy):
             )
             
             self.last_adjustment_time = time.time()
+            self._last_adjustment_mono = time.monotonic()
             
             self.logger.info(
                 f"S1 adjustment executed: {signal['action']} {adjusted_amount:.6f} "
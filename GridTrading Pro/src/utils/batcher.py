@@ -0,0 +1,83 @@
+"""
+Async batching utilities for GridTrading Pro.
+
+This module provides a small batcher that collects items submitted from
+coroutines and hands them to an async processor in groups, flushing when
+the batch is full or after a maximum queue time.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+
+class AsyncBatcher:
+    """Collect items and process them in batches."""
+
+    def __init__(
+        self,
+        processor: Callable[[List[Any]], Awaitable[Any]],
+        max_batch_size: int = 10,
+        max_queue_time: float = 0.5
+    ):
+        """Initialize batcher."""
+        self.processor = processor
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: Set[asyncio.Future] = set()
+
+    def submit(self, item: Any) -> asyncio.Future:
+        """Queue item and return a future resolved with the batch result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._schedule_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_queue_time, self._schedule_flush)
+
+        return future
+
+    async def process(self, item: Any) -> Any:
+        """Queue item and wait for its batch to be processed."""
+        return await self.submit(item)
+
+    def _schedule_flush(self) -> None:
+        """Flush pending items from a background task."""
+        # Hold a reference until the task finishes so it is not garbage-collected
+        task = asyncio.ensure_future(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> None:
+        """Process all pending items in batches of at most max_batch_size."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        while self._pending:
+            batch = self._pending[:self.max_batch_size]
+            self._pending = self._pending[self.max_batch_size:]
+            await self._process_batch(batch)
+
+    async def _process_batch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run the processor on one batch and resolve its futures."""
+        try:
+            result = await self.processor([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for _, future in batch:
+            if not future.done():
+                future.set_result(result)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of items waiting to be processed."""
+        return len(self._pending)
@@ -8,20 +8,88 @@ data formatting, time handling, and other common operations.
 import time
 import math
 import asyncio
+from bisect import bisect_left
+from itertools import islice
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Union
 from decimal import Decimal, ROUND_DOWN
 import numpy as np
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-
-def format_timestamp(timestamp: Optional[float] = None, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
+try:
+    from numba import njit
+except ImportError:  # numba is optional; pure-Python fallbacks are used
+    njit = None
+
+
+# Annualization factor for hourly returns (24 hours * 365 days)
+_ANNUALIZATION_FACTOR = math.sqrt(24 * 365)
+
+# Default timestamp format and last formatted second for format_timestamp
+_DEFAULT_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+_ts_cache = [-1, ""]
+
+# Volatility bins and matching grid adjustment interval multipliers
+_VOL_BINS = (0.2, 0.4, 0.8)
+_VOL_MULTS = (1.0, 0.75, 0.5, 0.25)  # 1 hour, 45, 30, 15 minutes
+
+# JSON encoding options: accept numpy values and non-string keys like the stdlib encoder
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Powers of ten for adjust_precision (covers every realistic exchange precision)
+_POW10_CACHE = tuple(10.0 ** i for i in range(19))
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _ema_kernel(prices, alpha):
+        """Compiled EMA recurrence over a float64 array."""
+        ema = prices[0]
+        for i in range(1, prices.shape[0]):
+            ema = alpha * prices[i] + (1.0 - alpha) * ema
+        return ema
+
+    @njit(cache=True, fastmath=True)
+    def _rolling_vol(prices, ann):
+        """Compiled single-pass Welford volatility of simple returns."""
+        if prices.shape[0] < 2:
+            return 0.0
+        mean = 0.0
+        m2 = 0.0
+        cnt = 0
+        for i in range(1, prices.shape[0]):
+            r = (prices[i] - prices[i - 1]) / prices[i - 1]
+            cnt += 1
+            d = r - mean
+            mean += d / cnt
+            m2 += d * (r - mean)
+        return (m2 / cnt) ** 0.5 * ann
+else:
+    _ema_kernel = None
+    _rolling_vol = None
+
+
+def format_timestamp(timestamp: Optional[float] = None, format_str: str = _DEFAULT_TIMESTAMP_FORMAT) -> str:
     """Format timestamp to readable string."""
+    if timestamp is None and format_str == _DEFAULT_TIMESTAMP_FORMAT:
+        # Reuse the formatted string until the second rolls over
+        now = int(time.time())
+        if now != _ts_cache[0]:
+            _ts_cache[1] = datetime.fromtimestamp(now).strftime(format_str)
+            _ts_cache[0] = now
+        return _ts_cache[1]
+    
     if timestamp is None:
         timestamp = time.time()
     return datetime.fromtimestamp(timestamp).strftime(format_str)
 
 
+def dumps_json(data: Any) -> bytes:
+    """Encode data as JSON bytes with orjson."""
+    return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+
+
 def calculate_percentage_change(old_value: float, new_value: float) -> float:
     """Calculate percentage change between two values."""
     if old_value == 0:
@@ -31,30 +99,23 @@ def calculate_percentage_change(old_value: float, new_value: float) -> float:
 
 def calculate_volatility(prices: List[float], window: int = 24) -> float:
     """Calculate price volatility using standard deviation."""
-    if len(prices) < 2:
-        return 0.0
+    if _rolling_vol is not None:
+        window_prices = np.asarray(prices[-window:], dtype=np.float64)
+        return float(_rolling_vol(window_prices, _ANNUALIZATION_FACTOR))
     
     # Use only the last 'window' prices
-    recent_prices = prices[-window:] if len(prices) > window else prices
+    # float32 is ample for return ratios and halves the array footprint
+    recent_prices = np.asarray(prices[-window:], dtype=np.float32)
     
-    if len(recent_prices) < 2:
+    if recent_prices.size < 2:
         return 0.0
     
     # Calculate returns
-    returns = []
-    for i in range(1, len(recent_prices)):
-        ret = (recent_prices[i] - recent_prices[i-1]) / recent_prices[i-1]
-        returns.append(ret)
-    
-    if not returns:
-        return 0.0
+    returns = np.diff(recent_prices) / recent_prices[:-1]
     
-    # Calculate standard deviation and annualize
-    std_dev = np.std(returns)
-    # Annualize assuming hourly data (24 hours * 365 days)
-    volatility = std_dev * math.sqrt(24 * 365)
-    
-    return volatility
+    # Calculate standard deviation (accumulated in float64) and annualize (assuming hourly data)
+    std_dev = returns.std(dtype=np.float64)
+    return float(std_dev) * _ANNUALIZATION_FACTOR
 
 
 def adjust_precision(amount: float, precision: int = 8) -> float:
@@ -62,8 +123,13 @@ def adjust_precision(amount: float, precision: int = 8) -> float:
     if precision <= 0:
         return float(int(amount))
     
-    factor = 10 ** precision
-    return math.floor(amount * factor) / factor
+    factor = _POW10_CACHE[precision] if precision < len(_POW10_CACHE) else 10.0 ** precision
+    scaled = amount * factor
+    
+    # int() truncates toward zero, which equals floor for non-negative amounts
+    if scaled >= 0:
+        return int(scaled) / factor
+    return math.floor(scaled) / factor
 
 
 def calculate_grid_levels(
@@ -74,19 +140,14 @@ def calculate_grid_levels(
     """Calculate grid buy and sell levels."""
     grid_decimal = grid_size / 100
     
-    buy_levels = []
-    sell_levels = []
-    
-    for i in range(1, num_levels + 1):
-        buy_price = base_price * (1 - grid_decimal * i)
-        sell_price = base_price * (1 + grid_decimal * i)
-        
-        buy_levels.append(buy_price)
-        sell_levels.append(sell_price)
+    # Offsets for levels 1..num_levels, broadcast over the base price
+    offsets = grid_decimal * np.arange(1, num_levels + 1, dtype=np.float64)
+    buy_levels = base_price * (1 - offsets)
+    sell_levels = base_price * (1 + offsets)
     
     return {
-        "buy_levels": buy_levels,
-        "sell_levels": sell_levels
+        "buy_levels": buy_levels.tolist(),
+        "sell_levels": sell_levels.tolist()
     }
 
 
@@ -110,14 +171,32 @@ def calculate_profit_loss(
     side: str
 ) -> float:
     """Calculate profit/loss for a position."""
-    if side.lower() == "buy":
+    side = side.lower()
+    if side == "buy":
         return (current_price - entry_price) * amount
-    elif side.lower() == "sell":
+    elif side == "sell":
         return (entry_price - current_price) * amount
     else:
         return 0.0
 
 
+def calculate_pnl_batch(
+    entry_prices: Union[np.ndarray, List[float]],
+    current_prices: Union[np.ndarray, List[float]],
+    amounts: Union[np.ndarray, List[float]],
+    sides: List[str]
+) -> np.ndarray:
+    """Calculate profit/loss for many positions at once."""
+    lowered = np.char.lower(np.asarray(sides, dtype=str))
+    
+    # +1 for buy, -1 for sell, 0 for unknown sides (matches calculate_profit_loss)
+    signs = np.where(lowered == "buy", 1.0, np.where(lowered == "sell", -1.0, 0.0))
+    
+    entries = np.asarray(entry_prices, dtype=np.float64)
+    currents = np.asarray(current_prices, dtype=np.float64)
+    return (currents - entries) * np.asarray(amounts, dtype=np.float64) * signs
+
+
 def format_currency(amount: float, currency: str = "USDT", decimals: int = 2) -> str:
     """Format currency amount with proper decimals."""
     return f"{amount:.{decimals}f} {currency}"
@@ -135,6 +214,21 @@ def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> f
     return numerator / denominator
 
 
+def safe_divide_array(
+    numerator: Union[np.ndarray, List[float], float],
+    denominator: Union[np.ndarray, List[float], float],
+    default: float = 0.0
+) -> np.ndarray:
+    """Element-wise safe division, returning default where denominator is zero."""
+    num = np.asarray(numerator, dtype=np.float64)
+    den = np.asarray(denominator, dtype=np.float64)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = np.divide(num, den)
+    
+    return np.where(den == 0, default, result)
+
+
 def clamp(value: float, min_value: float, max_value: float) -> float:
     """Clamp value between min and max."""
     return max(min_value, min(value, max_value))
@@ -142,8 +236,13 @@ def clamp(value: float, min_value: float, max_value: float) -> float:
 
 def exponential_backoff(attempt: int, base_delay: float = 1.0, max_delay: float = 60.0) -> float:
     """Calculate exponential backoff delay."""
-    delay = base_delay * (2 ** attempt)
-    return min(delay, max_delay)
+    # 2**30 seconds is far beyond any max_delay; skip the shift entirely
+    if attempt >= 30:
+        return max_delay
+    if attempt < 0:
+        return min(base_delay * (2 ** attempt), max_delay)
+    
+    return min(base_delay * float(1 << attempt), max_delay)
 
 
 @retry(
@@ -152,10 +251,7 @@ def exponential_backoff(attempt: int, base_delay: float = 1.0, max_delay: float
 )
 async def safe_async_call(func, *args, **kwargs):
     """Safely call async function with retry logic."""
-    try:
-        return await func(*args, **kwargs)
-    except Exception as e:
-        raise e
+    return await func(*args, **kwargs)
 
 
 def calculate_moving_average(prices: List[float], period: int) -> Optional[float]:
@@ -163,8 +259,8 @@ def calculate_moving_average(prices: List[float], period: int) -> Optional[float
     if len(prices) < period:
         return None
     
-    recent_prices = prices[-period:]
-    return sum(recent_prices) / len(recent_prices)
+    recent_prices = np.asarray(prices[-period:], dtype=np.float64)
+    return float(recent_prices.mean())
 
 
 def calculate_ema(prices: List[float], period: int, alpha: Optional[float] = None) -> Optional[float]:
@@ -175,6 +271,9 @@ def calculate_ema(prices: List[float], period: int, alpha: Optional[float] = Non
     if alpha is None:
         alpha = 2 / (period + 1)
     
+    if _ema_kernel is not None:
+        return float(_ema_kernel(np.asarray(prices, dtype=np.float64), float(alpha)))
+    
     ema = prices[0]
     for price in prices[1:]:
         ema = alpha * price + (1 - alpha) * ema
@@ -193,17 +292,9 @@ def get_next_grid_adjustment_time(
     base_interval: int = 3600
 ) -> float:
     """Calculate next grid adjustment time based on volatility."""
-    # Higher volatility = more frequent adjustments
-    if volatility > 0.8:
-        interval = base_interval * 0.25  # 15 minutes
-    elif volatility > 0.4:
-        interval = base_interval * 0.5   # 30 minutes
-    elif volatility > 0.2:
-        interval = base_interval * 0.75  # 45 minutes
-    else:
-        interval = base_interval         # 1 hour
-    
-    return last_adjustment + interval
+    # Higher volatility = more frequent adjustments (bins are exclusive lower bounds)
+    idx = bisect_left(_VOL_BINS, volatility)
+    return last_adjustment + base_interval * _VOL_MULTS[idx]
 
 
 def validate_trading_pair(symbol: str) -> bool:
@@ -252,9 +343,19 @@ def format_trade_message(
     )
 
 
+def ichunk(iterable: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Yield successive chunks of specified size from an iterable."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    
+    # Checked eagerly above; chunks are still produced lazily
+    it = iter(iterable)
+    return iter(lambda: list(islice(it, chunk_size)), [])
+
+
 def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     """Split list into chunks of specified size."""
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+    return list(ichunk(lst, chunk_size))
 
 
 async def wait_with_timeout(coro, timeout: float):
@@ -9,6 +9,7 @@ import os
 import sys
 import logging
 from logging.handlers import TimedRotatingFileHandler
+from types import MappingProxyType
 from typing import Optional
 from pathlib import Path
 
@@ -18,29 +19,44 @@ from ..config.settings import LoggingSettings
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with color support for console output."""
     
-    # Color codes
-    COLORS = {
+    # Color codes (read-only)
+    COLORS = MappingProxyType({
         'DEBUG': '\033[36m',    # Cyan
         'INFO': '\033[32m',     # Green
         'WARNING': '\033[33m',  # Yellow
         'ERROR': '\033[31m',    # Red
         'CRITICAL': '\033[35m', # Magenta
         'RESET': '\033[0m'      # Reset
-    }
+    })
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Precompute colored level names once
+        reset = self.COLORS['RESET']
+        self._colored = {
+            level: f"{code}{level}{reset}"
+            for level, code in self.COLORS.items() if level != 'RESET'
+        }
 
     def format(self, record):
-        # Add color to levelname
-        if record.levelname in self.COLORS:
-            record.levelname = (
-                f"{self.COLORS[record.levelname]}{record.levelname}"
-                f"{self.COLORS['RESET']}"
-            )
-        return super().format(record)
+        # Color levelname for this formatter only; the record is shared with other handlers
+        levelname = record.levelname
+        colored = self._colored.get(levelname)
+        if colored is None:
+            return super().format(record)
+        
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 class GridTradingLogger:
     """Custom logger class for GridTrading Pro."""
     
+    __slots__ = ("name", "settings", "logger")
+    
     def __init__(self, name: str, settings: Optional[LoggingSettings] = None):
         self.name = name
         self.settings = settings or LoggingSettings()
@@ -90,6 +106,10 @@ class GridTradingLogger:
         # Prevent propagation to root logger
         self.logger.propagate = False
     
+    def isEnabledFor(self, level: int) -> bool:
+        """Check if messages at level would be processed."""
+        return self.logger.isEnabledFor(level)
+    
     def debug(self, message: str, **kwargs):
         """Log debug message."""
         self.logger.debug(message, **kwargs)
@@ -9,6 +9,12 @@ import re
 from typing import Dict, Any, List, Optional, Union
 from decimal import Decimal
 
+import numpy as np
+
+
+# Precompiled validation patterns
+_BOT_TOKEN_RE = re.compile(r'^\d+:[a-zA-Z0-9_-]+$')  # e.g. 123456789:ABCdefGHIjklMNOpqrsTUVwxyz
+
 
 def validate_api_credentials(api_key: str, api_secret: str) -> bool:
     """Validate API credentials format."""
@@ -19,11 +25,11 @@ def validate_api_credentials(api_key: str, api_secret: str) -> bool:
     if len(api_key) < 10 or len(api_secret) < 10:
         return False
     
-    # Check for valid characters (alphanumeric)
-    if not re.match(r'^[a-zA-Z0-9]+$', api_key):
+    # Check for valid characters (ASCII alphanumeric)
+    if not (api_key.isascii() and api_key.isalnum()):
         return False
     
-    if not re.match(r'^[a-zA-Z0-9]+$', api_secret):
+    if not (api_secret.isascii() and api_secret.isalnum()):
         return False
     
     return True
@@ -119,6 +125,31 @@ def validate_order_response(order: Dict[str, Any]) -> bool:
     return True
 
 
+def validate_orders_batch(orders: List[Dict[str, Any]]) -> np.ndarray:
+    """Validate a batch of exchange order responses, returning a boolean mask."""
+    if not orders:
+        return np.zeros(0, dtype=bool)
+    
+    required_fields = {'id', 'symbol', 'side', 'amount', 'price', 'status'}
+    rows = [order if isinstance(order, dict) else {} for order in orders]
+    
+    mask = np.fromiter((required_fields.issubset(row) for row in rows), dtype=bool, count=len(rows))
+    mask &= np.fromiter((row.get('side') in ('buy', 'sell') for row in rows), dtype=bool, count=len(rows))
+    
+    try:
+        prices = np.array([row.get('price', 0) for row in rows], dtype=np.float64)
+        amounts = np.array([row.get('amount', 0) for row in rows], dtype=np.float64)
+    except (ValueError, TypeError):
+        # Non-numeric values somewhere in the batch; fall back to per-order checks
+        return np.array([validate_order_response(order) for order in orders], dtype=bool)
+    
+    # Missing values become NaN and fail both comparisons
+    mask &= prices > 0
+    mask &= amounts >= 0
+    
+    return mask
+
+
 def validate_balance_response(balance: Dict[str, Any]) -> bool:
     """Validate exchange balance response."""
     if not isinstance(balance, dict):
@@ -136,15 +167,9 @@ def validate_balance_response(balance: Dict[str, Any]) -> bool:
     return True
 
 
-def validate_kline_data(klines: List[List]) -> bool:
-    """Validate kline/candlestick data."""
-    if not isinstance(klines, list) or len(klines) == 0:
-        return False
-    
+def _validate_kline_rows(klines: List[List]) -> bool:
+    """Validate kline rows one at a time."""
     for kline in klines:
-        if not isinstance(kline, list) or len(kline) < 6:
-            return False
-        
         # Validate OHLCV data
         try:
             timestamp = float(kline[0])
@@ -173,14 +198,62 @@ def validate_kline_data(klines: List[List]) -> bool:
     return True
 
 
+def validate_kline_data(klines: List[List]) -> bool:
+    """Validate kline/candlestick data."""
+    if not isinstance(klines, list) or len(klines) == 0:
+        return False
+    
+    width = len(klines[0]) if isinstance(klines[0], list) else 0
+    ragged = False
+    for kline in klines:
+        if not isinstance(kline, list) or len(kline) < 6:
+            return False
+        ragged = ragged or len(kline) != width
+    
+    # Ragged rows cannot form one array; check them row by row
+    if ragged:
+        return _validate_kline_rows(klines)
+    
+    # Convert all rows at once; anything NumPy rejects gets the exact per-row check
+    try:
+        data = np.asarray(klines, dtype=np.float64)
+    except (ValueError, TypeError, OverflowError):
+        return _validate_kline_rows(klines)
+    
+    # Nested cells, or NaN that may have come from None, need the per-row check
+    if data.ndim != 2 or np.isnan(data[:, :6]).any():
+        return _validate_kline_rows(klines)
+    
+    # Validate OHLCV data (columns: timestamp, open, high, low, close, volume)
+    open_prices = data[:, 1]
+    high_prices = data[:, 2]
+    low_prices = data[:, 3]
+    close_prices = data[:, 4]
+    volumes = data[:, 5]
+    
+    # Basic sanity checks
+    if not ((open_prices > 0) & (high_prices > 0) & (low_prices > 0) & (close_prices > 0)).all():
+        return False
+    
+    if not (high_prices >= np.maximum(open_prices, close_prices)).all():
+        return False
+    
+    if not (low_prices <= np.minimum(open_prices, close_prices)).all():
+        return False
+    
+    if not (volumes >= 0).all():
+        return False
+    
+    return True
+
+
 def validate_telegram_config(bot_token: str, chat_id: str) -> bool:
     """Validate Telegram configuration."""
     if not bot_token or not chat_id:
         return False
     
-    # Validate bot token format (should be like: 123456789:ABCdefGHIjklMNOpqrsTUVwxyz)
-    bot_token_pattern = r'^\d+:[a-zA-Z0-9_-]+$'
-    if not re.match(bot_token_pattern, bot_token):
+    # Validate bot token format
+    if not _BOT_TOKEN_RE.match(bot_token):
         return False
     
     # Validate chat ID (can be negative for groups)
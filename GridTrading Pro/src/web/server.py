@@ -6,12 +6,381 @@ the trading system status and performance.
 """
 
 from aiohttp import web
+import asyncio
+import gzip
+import hashlib
 import json
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Awaitable, Callable, Set, Tuple
+
+import numpy as np
 
 from ..utils.logger import get_logger
+from ..utils.helpers import dumps_json
 from ..config.settings import Settings
+from ..config.constants import (
+    WEB_STATUS_CACHE_TTL, WEB_ANALYTICS_CACHE_TTL, WEB_COMPRESS_MIN_BYTES,
+    WEB_PUSH_INTERVAL, WEB_API_CACHE_CONTROL, HTTP_KEEPALIVE_TIMEOUT
+)
+
+
+def _json_bytes(body: bytes, status: int = 200) -> web.Response:
+    """Build a JSON response from already encoded bytes."""
+    response = web.Response(body=body, status=status, content_type='application/json')
+    if status == 200:
+        # Let the browser reuse a response across polling bursts; never shared caches
+        response.headers['Cache-Control'] = WEB_API_CACHE_CONTROL
+    if len(body) >= WEB_COMPRESS_MIN_BYTES:
+        # Compressed per Accept-Encoding when the response is prepared
+        response.enable_compression()
+        response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+
+def _ojson(data: Any, status: int = 200) -> web.Response:
+    """Build a JSON response encoded with orjson."""
+    return _json_bytes(dumps_json(data), status=status)
+
+
+# Numeric trade fields sent as columns
+_TRADE_NUMERIC_FIELDS = ('timestamp', 'price', 'amount', 'total', 'profit')
+
+
+def _static_response(
+    request: web.Request,
+    body: bytes,
+    gzip_body: bytes,
+    content_type: str,
+    headers: Dict[str, str]
+) -> web.Response:
+    """Build a static asset response, using the precompressed body when accepted."""
+    headers = dict(headers, Vary='Accept-Encoding')
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        body = gzip_body
+        headers['Content-Encoding'] = 'gzip'
+    
+    return web.Response(body=body, content_type=content_type, charset='utf-8', headers=headers)
+
+
+def _trades_to_columns(trades: list) -> Dict[str, Any]:
+    """Transpose a list of trade dicts into column arrays."""
+    count = len(trades)
+    columns: Dict[str, Any] = {
+        field: np.fromiter(
+            (float(trade.get(field) or 0) for trade in trades),
+            dtype=np.float64,
+            count=count
+        )
+        for field in _TRADE_NUMERIC_FIELDS
+    }
+    columns['side'] = [trade.get('side', '') for trade in trades]
+    return columns
+
+
+# Dashboard script, served from a content-hashed URL so browsers can cache it forever
+_DASHBOARD_JS = """
+const TRADE_LIMIT = 10;
+let pollTimer = null;
+
+// Keys of trades currently shown, so refreshes only add new rows
+const seenTrades = new Set();
+
+// DOM elements, looked up once (the script loads after the page body)
+const el = {
+    systemStatus: document.getElementById('system-status'),
+    currentPrice: document.getElementById('current-price'),
+    gridSize: document.getElementById('grid-size'),
+    totalProfit: document.getElementById('total-profit'),
+    tradesBody: document.getElementById('trades-body'),
+    totalTrades: document.getElementById('total-trades'),
+    winRate: document.getElementById('win-rate'),
+    profitFactor: document.getElementById('profit-factor'),
+    maxDrawdown: document.getElementById('max-drawdown')
+};
+
+function updateStatus(status) {
+    el.systemStatus.textContent = status.is_running ? 'RUNNING' : 'STOPPED';
+    el.systemStatus.className = 'metric-value ' + (status.is_running ? 'running' : 'stopped');
+    el.currentPrice.textContent = status.current_price ? status.current_price.toFixed(4) : '--';
+    el.gridSize.textContent = status.grid_size ? status.grid_size.toFixed(1) + '%' : '--';
+    el.totalProfit.textContent = status.total_profit ? status.total_profit.toFixed(2) + ' USDT' : '--';
+}
+
+function updateAnalytics(analytics) {
+    el.totalTrades.textContent = analytics.total_trades || 0;
+    el.winRate.textContent = analytics.win_rate ? (analytics.win_rate * 100).toFixed(1) + '%' : '--';
+    el.profitFactor.textContent = analytics.profit_factor ? analytics.profit_factor.toFixed(2) : '--';
+    el.maxDrawdown.textContent = analytics.max_drawdown ? (analytics.max_drawdown * 100).toFixed(1) + '%' : '--';
+}
+
+// Static row markup, shared by every rendered trade
+const ROW_OPEN = '<tr data-key="';
+const ROW_TIME = '"><td>';
+const ROW_SIDE = '</td><td class="';
+const ROW_SIDE_TEXT = '">';
+const CELL_SEP = '</td><td>';
+const ROW_CLOSE = '</td></tr>';
+
+function pushTradeRow(parts, key, timestamp, side, price, amount, total, profit) {
+    seenTrades.add(key);
+    parts.push(
+        ROW_OPEN, key, ROW_TIME, new Date(timestamp * 1000).toLocaleString(),
+        ROW_SIDE, side === 'buy' ? 'buy' : 'sell', ROW_SIDE_TEXT, side.toUpperCase(),
+        CELL_SEP, price.toFixed(4),
+        CELL_SEP, amount.toFixed(6),
+        CELL_SEP, total.toFixed(2),
+        CELL_SEP, profit.toFixed(2),
+        ROW_CLOSE
+    );
+}
+
+function tradeKey(timestamp, price) {
+    return timestamp + '|' + price;
+}
+
+function clearPlaceholder(tbody) {
+    // Drop the "Loading..." / "No trades yet" row
+    if (tbody.rows.length === 1 && tbody.rows[0].cells.length === 1) {
+        tbody.innerHTML = '';
+    }
+}
+
+function prependRows(tbody, parts) {
+    clearPlaceholder(tbody);
+    tbody.insertAdjacentHTML('afterbegin', parts.join(''));
+    trimTrades(tbody);
+}
+
+function trimTrades(tbody) {
+    while (tbody.rows.length > TRADE_LIMIT) {
+        seenTrades.delete(tbody.rows[tbody.rows.length - 1].dataset.key);
+        tbody.deleteRow(-1);
+    }
+}
+
+function renderTrades(trades) {
+    const tbody = el.tradesBody;
+
+    // Trades arrive as columns: one array per field
+    const count = trades.timestamp.length;
+    if (count === 0) {
+        if (seenTrades.size === 0) {
+            tbody.innerHTML = '<tr><td colspan="6">No trades yet</td></tr>';
+        }
+        return;
+    }
+
+    // Build markup for rows not shown yet, then insert it with one HTML parse
+    const parts = [];
+    for (let i = 0; i < count; i++) {
+        const key = tradeKey(trades.timestamp[i], trades.price[i]);
+        if (seenTrades.has(key)) {
+            continue;
+        }
+        pushTradeRow(
+            parts, key, trades.timestamp[i], trades.side[i], trades.price[i],
+            trades.amount[i], trades.total[i], trades.profit[i]
+        );
+    }
+
+    if (parts.length > 0) {
+        prependRows(tbody, parts);
+    }
+}
+
+function prependTrade(trade) {
+    const tbody = el.tradesBody;
+    const key = tradeKey(trade.timestamp, trade.price || 0);
+    if (seenTrades.has(key)) {
+        return;
+    }
+
+    const parts = [];
+    pushTradeRow(
+        parts, key, trade.timestamp, trade.side || '', trade.price || 0,
+        trade.amount || 0, trade.total || 0, trade.profit || 0
+    );
+    prependRows(tbody, parts);
+}
+
+async function loadData() {
+    try {
+        // Load status, trades and analytics in one request
+        const response = await fetch('/api/dashboard?limit=' + TRADE_LIMIT);
+        const data = await response.json();
+
+        updateStatus(data.status);
+        renderTrades(data.trades);
+        updateAnalytics(data.analytics);
+
+    } catch (error) {
+        console.error('Failed to load data:', error);
+    }
+}
+
+function startPolling() {
+    if (pollTimer === null) {
+        pollTimer = setInterval(loadData, 5000);
+    }
+}
+
+function stopPolling() {
+    if (pollTimer !== null) {
+        clearInterval(pollTimer);
+        pollTimer = null;
+    }
+}
+
+function connectSocket() {
+    if (!('WebSocket' in window)) {
+        return;
+    }
+
+    const protocol = location.protocol === 'https:' ? 'wss:' : 'ws:';
+    const socket = new WebSocket(protocol + '//' + location.host + '/ws/dashboard');
+
+    // Server pushes deltas while connected; polling is the fallback.
+    // Reload once after subscribing so trades made since the last poll show up.
+    socket.onopen = () => {
+        stopPolling();
+        loadData();
+    };
+    socket.onmessage = event => {
+        const message = JSON.parse(event.data);
+        if (message.type === 'trade') {
+            prependTrade(message.row);
+        } else if (message.type === 'status') {
+            updateStatus(message.data);
+        } else if (message.type === 'analytics') {
+            updateAnalytics(message.data);
+        }
+    };
+    socket.onclose = () => {
+        startPolling();
+        setTimeout(connectSocket, 5000);
+    };
+}
+
+// Load data on page load
+loadData();
+
+// Auto-refresh every 5 seconds until the WebSocket connects
+startPolling();
+connectSocket();
+"""
+_DASHBOARD_JS_BYTES = _DASHBOARD_JS.encode('utf-8')
+_DASHBOARD_JS_GZIP = gzip.compress(_DASHBOARD_JS_BYTES, 9)
+_DASHBOARD_JS_URL = f"/static/dashboard.{hashlib.blake2b(_DASHBOARD_JS_BYTES, digest_size=8).hexdigest()}.js"
+
+
+# Dashboard page, encoded once at import and served with a content ETag
+_DASHBOARD_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>GridTrading Pro Dashboard</title>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; }
+        .card { background: white; padding: 20px; margin: 10px 0; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .header { text-align: center; color: #333; }
+        .status { display: flex; justify-content: space-between; flex-wrap: wrap; }
+        .metric { text-align: center; padding: 10px; }
+        .metric-value { font-size: 24px; font-weight: bold; color: #2563eb; }
+        .metric-label { color: #666; font-size: 14px; }
+        .running { color: #10b981; }
+        .stopped { color: #ef4444; }
+        .trades-table { width: 100%; border-collapse: collapse; }
+        .trades-table th, .trades-table td { padding: 8px; text-align: left; border-bottom: 1px solid #ddd; }
+        .trades-table th { background: #f8f9fa; }
+        .buy { color: #10b981; }
+        .sell { color: #ef4444; }
+        .refresh-btn { background: #2563eb; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer; }
+        .refresh-btn:hover { background: #1d4ed8; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="card">
+            <h1 class="header">GridTrading Pro Dashboard</h1>
+            <p class="header">Advanced Grid Trading System v2.0.0</p>
+        </div>
+        
+        <div class="card">
+            <h2>System Status</h2>
+            <div class="status" id="status-container">
+                <div class="metric">
+                    <div class="metric-value" id="system-status">Loading...</div>
+                    <div class="metric-label">System Status</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value" id="current-price">--</div>
+                    <div class="metric-label">Current Price</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value" id="grid-size">--</div>
+                    <div class="metric-label">Grid Size</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value" id="total-profit">--</div>
+                    <div class="metric-label">Total Profit</div>
+                </div>
+            </div>
+        </div>
+        
+        <div class="card">
+            <h2>Recent Trades</h2>
+            <button class="refresh-btn" onclick="loadData()">Refresh</button>
+            <table class="trades-table" id="trades-table">
+                <thead>
+                    <tr>
+                        <th>Time</th>
+                        <th>Side</th>
+                        <th>Price</th>
+                        <th>Amount</th>
+                        <th>Total</th>
+                        <th>Profit</th>
+                    </tr>
+                </thead>
+                <tbody id="trades-body">
+                    <tr><td colspan="6">Loading...</td></tr>
+                </tbody>
+            </table>
+        </div>
+        
+        <div class="card">
+            <h2>Performance Analytics</h2>
+            <div class="status" id="analytics-container">
+                <div class="metric">
+                    <div class="metric-value" id="total-trades">--</div>
+                    <div class="metric-label">Total Trades</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value" id="win-rate">--</div>
+                    <div class="metric-label">Win Rate</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value" id="profit-factor">--</div>
+                    <div class="metric-label">Profit Factor</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value" id="max-drawdown">--</div>
+                    <div class="metric-label">Max Drawdown</div>
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    <script src="__DASHBOARD_JS_URL__"></script>
+</body>
+</html>
+"""
+_DASHBOARD_HTML_BYTES = _DASHBOARD_HTML.replace('__DASHBOARD_JS_URL__', _DASHBOARD_JS_URL).encode('utf-8')
+_DASHBOARD_HTML_GZIP = gzip.compress(_DASHBOARD_HTML_BYTES, 9)
+# Weak ETag: identical for the plain and gzip encodings of the page
+_DASHBOARD_ETAG = f'W/"{hashlib.blake2b(_DASHBOARD_HTML_BYTES, digest_size=8).hexdigest()}"'
 
 
 class WebServer:
@@ -27,15 +396,29 @@ class WebServer:
         self.runner = None
         self.site = None
         
+        # Encoded response cache: key -> (monotonic timestamp, JSON bytes)
+        self._cache: Dict[str, Tuple[float, bytes]] = {}
+        self._cache_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Last analytics payload and the trade version it was computed for
+        self._analytics_memo: Optional[Tuple[Any, Dict[str, Any]]] = None
+        
+        # Connected dashboard WebSockets and the task pushing updates to them
+        self._websockets: Set[web.WebSocketResponse] = set()
+        self._push_task: Optional[asyncio.Task] = None
+        
         # Setup routes
         self._setup_routes()
     
     def _setup_routes(self):
         """Setup web routes."""
         self.app.router.add_get('/', self.handle_dashboard)
+        self.app.router.add_get(_DASHBOARD_JS_URL, self.handle_dashboard_js)
         self.app.router.add_get('/api/status', self.handle_api_status)
         self.app.router.add_get('/api/trades', self.handle_api_trades)
         self.app.router.add_get('/api/analytics', self.handle_api_analytics)
+        self.app.router.add_get('/api/dashboard', self.handle_api_dashboard)
+        self.app.router.add_get('/ws/dashboard', self.handle_ws_dashboard)
     
     async def start(self):
         """Start web server."""
@@ -44,7 +427,8 @@ class WebServer:
             return
         
         try:
-            self.runner = web.AppRunner(self.app)
+            # Keep idle dashboard connections open between polls
+            self.runner = web.AppRunner(self.app, keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT)
             await self.runner.setup()
             
             self.site = web.TCPSite(
@@ -63,236 +447,280 @@ class WebServer:
     
     async def stop(self):
         """Stop web server."""
+        if self._push_task and not self._push_task.done():
+            self._push_task.cancel()
+        
+        for ws in list(self._websockets):
+            await ws.close()
+        self._websockets.clear()
+        
         if self.runner:
             await self.runner.cleanup()
         self.logger.info("Web server stopped")
     
     async def handle_dashboard(self, request):
         """Handle dashboard page."""
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>GridTrading Pro Dashboard</title>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1">
-            <style>
-                body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
-                .container { max-width: 1200px; margin: 0 auto; }
-                .card { background: white; padding: 20px; margin: 10px 0; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-                .header { text-align: center; color: #333; }
-                .status { display: flex; justify-content: space-between; flex-wrap: wrap; }
-                .metric { text-align: center; padding: 10px; }
-                .metric-value { font-size: 24px; font-weight: bold; color: #2563eb; }
-                .metric-label { color: #666; font-size: 14px; }
-                .running { color: #10b981; }
-                .stopped { color: #ef4444; }
-                .trades-table { width: 100%; border-collapse: collapse; }
-                .trades-table th, .trades-table td { padding: 8px; text-align: left; border-bottom: 1px solid #ddd; }
-                .trades-table th { background: #f8f9fa; }
-                .buy { color: #10b981; }
-                .sell { color: #ef4444; }
-                .refresh-btn { background: #2563eb; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer; }
-                .refresh-btn:hover { background: #1d4ed8; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="card">
-                    <h1 class="header">GridTrading Pro Dashboard</h1>
-                    <p class="header">Advanced Grid Trading System v2.0.0</p>
-                </div>
-                
-                <div class="card">
-                    <h2>System Status</h2>
-                    <div class="status" id="status-container">
-                        <div class="metric">
-                            <div class="metric-value" id="system-status">Loading...</div>
-                            <div class="metric-label">System Status</div>
-                        </div>
-                        <div class="metric">
-                            <div class="metric-value" id="current-price">--</div>
-                            <div class="metric-label">Current Price</div>
-                        </div>
-                        <div class="metric">
-                            <div class="metric-value" id="grid-size">--</div>
-                            <div class="metric-label">Grid Size</div>
-                        </div>
-                        <div class="metric">
-                            <div class="metric-value" id="total-profit">--</div>
-                            <div class="metric-label">Total Profit</div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="card">
-                    <h2>Recent Trades</h2>
-                    <button class="refresh-btn" onclick="loadData()">Refresh</button>
-                    <table class="trades-table" id="trades-table">
-                        <thead>
-                            <tr>
-                                <th>Time</th>
-                                <th>Side</th>
-                                <th>Price</th>
-                                <th>Amount</th>
-                                <th>Total</th>
-                                <th>Profit</th>
-                            </tr>
-                        </thead>
-                        <tbody id="trades-body">
-                            <tr><td colspan="6">Loading...</td></tr>
-                        </tbody>
-                    </table>
-                </div>
-                
-                <div class="card">
-                    <h2>Performance Analytics</h2>
-                    <div class="status" id="analytics-container">
-                        <div class="metric">
-                            <div class="metric-value" id="total-trades">--</div>
-                            <div class="metric-label">Total Trades</div>
-                        </div>
-                        <div class="metric">
-                            <div class="metric-value" id="win-rate">--</div>
-                            <div class="metric-label">Win Rate</div>
-                        </div>
-                        <div class="metric">
-                            <div class="metric-value" id="profit-factor">--</div>
-                            <div class="metric-label">Profit Factor</div>
-                        </div>
-                        <div class="metric">
-                            <div class="metric-value" id="max-drawdown">--</div>
-                            <div class="metric-label">Max Drawdown</div>
-                        </div>
-                    </div>
-                </div>
-            </div>
+        if request.headers.get('If-None-Match') == _DASHBOARD_ETAG:
+            return web.Response(status=304, headers={'ETag': _DASHBOARD_ETAG})
+        
+        return _static_response(
+            request,
+            _DASHBOARD_HTML_BYTES,
+            _DASHBOARD_HTML_GZIP,
+            'text/html',
+            {'ETag': _DASHBOARD_ETAG, 'Cache-Control': 'public, max-age=60'}
+        )
+    
+    async def handle_dashboard_js(self, request):
+        """Handle dashboard script asset."""
+        return _static_response(
+            request,
+            _DASHBOARD_JS_BYTES,
+            _DASHBOARD_JS_GZIP,
+            'application/javascript',
+            {'Cache-Control': 'public, max-age=31536000, immutable'}
+        )
+    
+    async def _cached_json(
+        self,
+        key: str,
+        ttl: float,
+        builder: Callable[[], Awaitable[Any]]
+    ) -> bytes:
+        """Return encoded payload for key, rebuilding it at most once per TTL."""
+        entry = self._cache.get(key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        
+        lock = self._cache_locks.get(key)
+        if lock is None:
+            lock = self._cache_locks[key] = asyncio.Lock()
+        
+        # Single-flight: concurrent misses wait for the first builder
+        async with lock:
+            entry = self._cache.get(key)
+            if entry and time.monotonic() - entry[0] < ttl:
+                return entry[1]
             
-            <script>
-                async function loadData() {
-                    try {
-                        // Load status
-                        const statusResponse = await fetch('/api/status');
-                        const status = await statusResponse.json();
-                        
-                        document.getElementById('system-status').textContent = status.is_running ? 'RUNNING' : 'STOPPED';
-                        document.getElementById('system-status').className = 'metric-value ' + (status.is_running ? 'running' : 'stopped');
-                        document.getElementById('current-price').textContent = status.current_price ? status.current_price.toFixed(4) : '--';
-                        document.getElementById('grid-size').textContent = status.grid_size ? status.grid_size.toFixed(1) + '%' : '--';
-                        document.getElementById('total-profit').textContent = status.total_profit ? status.total_profit.toFixed(2) + ' USDT' : '--';
-                        
-                        // Load trades
-                        const tradesResponse = await fetch('/api/trades?limit=10');
-                        const trades = await tradesResponse.json();
-                        
-                        const tbody = document.getElementById('trades-body');
-                        tbody.innerHTML = '';
-                        
-                        if (trades.length === 0) {
-                            tbody.innerHTML = '<tr><td colspan="6">No trades yet</td></tr>';
-                        } else {
-                            trades.forEach(trade => {
-                                const row = document.createElement('tr');
-                                const time = new Date(trade.timestamp * 1000).toLocaleString();
-                                const sideClass = trade.side === 'buy' ? 'buy' : 'sell';
-                                
-                                row.innerHTML = `
-                                    <td>${time}</td>
-                                    <td class="${sideClass}">${trade.side.toUpperCase()}</td>
-                                    <td>${trade.price.toFixed(4)}</td>
-                                    <td>${trade.amount.toFixed(6)}</td>
-                                    <td>${trade.total.toFixed(2)}</td>
-                                    <td>${trade.profit ? trade.profit.toFixed(2) : '0.00'}</td>
-                                `;
-                                tbody.appendChild(row);
-                            });
-                        }
-                        
-                        // Load analytics
-                        const analyticsResponse = await fetch('/api/analytics');
-                        const analytics = await analyticsResponse.json();
-                        
-                        document.getElementById('total-trades').textContent = analytics.total_trades || 0;
-                        document.getElementById('win-rate').textContent = analytics.win_rate ? (analytics.win_rate * 100).toFixed(1) + '%' : '--';
-                        document.getElementById('profit-factor').textContent = analytics.profit_factor ? analytics.profit_factor.toFixed(2) : '--';
-                        document.getElementById('max-drawdown').textContent = analytics.max_drawdown ? (analytics.max_drawdown * 100).toFixed(1) + '%' : '--';
-                        
-                    } catch (error) {
-                        console.error('Failed to load data:', error);
-                    }
-                }
-                
-                // Load data on page load
-                loadData();
-                
-                // Auto-refresh every 5 seconds
-                setInterval(loadData, 5000);
-            </script>
-        </body>
-        </html>
-        """
-        return web.Response(text=html, content_type='text/html')
+            body = dumps_json(await builder())
+            self._cache[key] = (time.monotonic(), body)
+            return body
+    
+    async def _status_json(self) -> bytes:
+        """Return encoded status, preferring the snapshot published by the engine."""
+        snapshot = getattr(self.grid_engine, 'status_snapshot', None) if self.grid_engine else None
+        if snapshot is not None:
+            return snapshot
+        return await self._cached_json('status', WEB_STATUS_CACHE_TTL, self._status_payload)
+    
+    async def _status_payload(self) -> Dict[str, Any]:
+        """Build status payload."""
+        if self.grid_engine:
+            return self.grid_engine.get_status()
+        
+        return {
+            'is_running': False,
+            'symbol': self.settings.trading.symbol,
+            'current_price': 0,
+            'grid_size': 0,
+            'total_profit': 0,
+            'trade_count': 0
+        }
+    
+    async def _trades_payload(self, limit: int) -> list:
+        """Build recent trades payload."""
+        if self.grid_engine and hasattr(self.grid_engine, 'data_manager'):
+            return self.grid_engine.data_manager.get_trades(limit=limit)
+        return []
+    
+    def _trades_version(self) -> Optional[Tuple[int, float]]:
+        """Return (trade count, last trade timestamp) if the data manager tracks it."""
+        data_manager = getattr(self.grid_engine, 'data_manager', None) if self.grid_engine else None
+        if data_manager is not None and hasattr(data_manager, 'trades_version'):
+            return data_manager.trades_version()
+        return None
+    
+    async def _trades_columns_payload(self, limit: int) -> Dict[str, Any]:
+        """Build recent trades payload in columnar form."""
+        data_manager = getattr(self.grid_engine, 'data_manager', None) if self.grid_engine else None
+        if data_manager is not None and hasattr(data_manager, 'get_trades_columns'):
+            return data_manager.get_trades_columns(limit=limit)
+        
+        return _trades_to_columns(await self._trades_payload(limit))
+    
+    def _analytics_version(self) -> Any:
+        """Return a cheap key that changes whenever a new trade is persisted."""
+        version = self._trades_version()
+        if version is not None:
+            return version
+        # trade_count is bumped before the trade is saved, so key on the saved count
+        return getattr(self.grid_engine, 'saved_trade_count', None)
+    
+    async def _analytics_payload(self) -> Dict[str, Any]:
+        """Build analytics payload."""
+        if self.grid_engine and hasattr(self.grid_engine, 'data_manager'):
+            # Analytics only change with new trades; reuse the last result until then
+            version = self._analytics_version()
+            if self._analytics_memo is not None and self._analytics_memo[0] == version:
+                return self._analytics_memo[1]
+            
+            analytics = await self.grid_engine.data_manager.get_analytics()
+            analytics_dict = {
+                'total_trades': analytics.total_trades,
+                'win_rate': analytics.win_rate,
+                'total_profit': analytics.total_profit,
+                'profit_factor': analytics.profit_factor,
+                'max_drawdown': analytics.max_loss / analytics.total_profit if analytics.total_profit != 0 else 0
+            }
+            self._analytics_memo = (version, analytics_dict)
+            return analytics_dict
+        
+        return {
+            'total_trades': 0,
+            'win_rate': 0,
+            'total_profit': 0,
+            'profit_factor': 0,
+            'max_drawdown': 0
+        }
     
     async def handle_api_status(self, request):
         """Handle status API endpoint."""
         try:
-            if self.grid_engine:
-                status = self.grid_engine.get_status()
-            else:
-                status = {
-                    'is_running': False,
-                    'symbol': self.settings.trading.symbol,
-                    'current_price': 0,
-                    'grid_size': 0,
-                    'total_profit': 0,
-                    'trade_count': 0
-                }
-            
-            return web.json_response(status)
+            return _json_bytes(await self._status_json())
             
         except Exception as e:
             self.logger.error(f"Status API error: {str(e)}")
-            return web.json_response({'error': str(e)}, status=500)
+            return _ojson({'error': str(e)}, status=500)
     
     async def handle_api_trades(self, request):
         """Handle trades API endpoint."""
         try:
             limit = int(request.query.get('limit', 10))
+            columns = request.query.get('format') == 'columns'
+            
+            # Trades are append-only, so (count, last timestamp) identifies the response
+            trades = None
+            version = self._trades_version()
+            if version is None:
+                trades = await self._trades_payload(limit)
+                version = (len(trades), max(((trade.get('timestamp') or 0) for trade in trades), default=0))
             
-            if self.grid_engine and hasattr(self.grid_engine, 'data_manager'):
-                trades = self.grid_engine.data_manager.get_trades(limit=limit)
+            # Weak ETag: shared by the plain and compressed encodings
+            etag = f'W/"{version[0]}-{version[1]}-{limit}{"c" if columns else ""}"'
+            if request.headers.get('If-None-Match') == etag:
+                return web.Response(status=304, headers={'ETag': etag})
+            
+            if columns:
+                payload = _trades_to_columns(trades) if trades is not None else await self._trades_columns_payload(limit)
             else:
-                trades = []
+                payload = trades if trades is not None else await self._trades_payload(limit)
             
-            return web.json_response(trades)
+            response = _ojson(payload)
+            response.headers['ETag'] = etag
+            return response
             
         except Exception as e:
             self.logger.error(f"Trades API error: {str(e)}")
-            return web.json_response({'error': str(e)}, status=500)
+            return _ojson({'error': str(e)}, status=500)
     
     async def handle_api_analytics(self, request):
         """Handle analytics API endpoint."""
         try:
-            if self.grid_engine and hasattr(self.grid_engine, 'data_manager'):
-                analytics = await self.grid_engine.data_manager.get_analytics()
-                analytics_dict = {
-                    'total_trades': analytics.total_trades,
-                    'win_rate': analytics.win_rate,
-                    'total_profit': analytics.total_profit,
-                    'profit_factor': analytics.profit_factor,
-                    'max_drawdown': analytics.max_loss / analytics.total_profit if analytics.total_profit != 0 else 0
-                }
-            else:
-                analytics_dict = {
-                    'total_trades': 0,
-                    'win_rate': 0,
-                    'total_profit': 0,
-                    'profit_factor': 0,
-                    'max_drawdown': 0
-                }
-            
-            return web.json_response(analytics_dict)
+            body = await self._cached_json('analytics', WEB_ANALYTICS_CACHE_TTL, self._analytics_payload)
+            return _json_bytes(body)
             
         except Exception as e:
             self.logger.error(f"Analytics API error: {str(e)}")
-            return web.json_response({'error': str(e)}, status=500)
+            return _ojson({'error': str(e)}, status=500)
+    
+    async def _dashboard_payload(self, limit: int) -> Dict[str, Any]:
+        """Build combined dashboard payload."""
+        status, trades, analytics = await asyncio.gather(
+            self._status_payload(),
+            self._trades_columns_payload(limit),
+            self._analytics_payload()
+        )
+        return {'status': status, 'trades': trades, 'analytics': analytics}
+    
+    async def handle_api_dashboard(self, request):
+        """Handle combined dashboard API endpoint."""
+        try:
+            # Clamp limit so the per-limit cache stays small
+            limit = min(max(int(request.query.get('limit', 10)), 1), 100)
+            body = await self._cached_json(
+                f'dashboard:{limit}',
+                WEB_STATUS_CACHE_TTL,
+                lambda: self._dashboard_payload(limit)
+            )
+            return _json_bytes(body)
+            
+        except Exception as e:
+            self.logger.error(f"Dashboard API error: {str(e)}")
+            return _ojson({'error': str(e)}, status=500)
+    
+    async def handle_ws_dashboard(self, request):
+        """Handle dashboard WebSocket, pushing status, analytics and new trades."""
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        
+        self._websockets.add(ws)
+        if self._push_task is None or self._push_task.done():
+            self._push_task = asyncio.ensure_future(self._push_loop())
+        
+        try:
+            # Client messages are not used; iterate until the socket closes
+            async for _ in ws:
+                pass
+        finally:
+            self._websockets.discard(ws)
+        
+        return ws
+    
+    async def _push_loop(self):
+        """Push dashboard deltas to connected WebSockets while any are open."""
+        last_status = None
+        last_analytics = None
+        last_trade_ts = None
+        
+        while self._websockets:
+            try:
+                status = await self._status_json()
+                if status != last_status:
+                    await self._broadcast(b'{"type":"status","data":' + status + b'}')
+                    last_status = status
+                
+                analytics = await self._cached_json('analytics', WEB_ANALYTICS_CACHE_TTL, self._analytics_payload)
+                if analytics != last_analytics:
+                    await self._broadcast(b'{"type":"analytics","data":' + analytics + b'}')
+                    last_analytics = analytics
+                
+                # Only trades newer than the last pushed one; clients load the initial list over HTTP
+                trades = await self._trades_payload(10)
+                newest = max(((trade.get('timestamp') or 0) for trade in trades), default=0)
+                if last_trade_ts is not None:
+                    new_trades = sorted(
+                        (trade for trade in trades if (trade.get('timestamp') or 0) > last_trade_ts),
+                        key=lambda trade: (trade.get('timestamp') or 0)
+                    )
+                    for trade in new_trades:
+                        await self._broadcast(dumps_json({'type': 'trade', 'row': trade}))
+                last_trade_ts = max(newest, last_trade_ts or 0)
+                
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Dashboard push error: {str(e)}")
+            
+            await asyncio.sleep(WEB_PUSH_INTERVAL)
+    
+    async def _broadcast(self, message: bytes):
+        """Send a JSON message to every connected dashboard WebSocket."""
+        text = message.decode('utf-8')
+        sockets = [ws for ws in self._websockets if not ws.closed]
+        results = await asyncio.gather(
+            *(ws.send_str(text) for ws in sockets),
+            return_exceptions=True
+        )
+        for ws, result in zip(sockets, results):
+            if isinstance(result, Exception):
+                self._websockets.discard(ws)
@@ -4,9 +4,27 @@ Script to synchronize environment variables between .env.testnet and .env
 """
 
 import os
+import re
+import mmap
 import shutil
 from pathlib import Path
 
+def _copy_file(src: Path, dst: Path):
+    """Copy file contents in kernel space, falling back to shutil.copy2"""
+    try:
+        with open(src, 'rb') as s, open(dst, 'wb') as d:
+            size = os.fstat(s.fileno()).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(d.fileno(), s.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        shutil.copystat(src, dst)
+    except (AttributeError, OSError):
+        # os.sendfile is unavailable (Windows) or can't target regular files here
+        shutil.copy2(src, dst)
+
 def sync_env_files():
     """Synchronize .env.testnet to .env"""
     
@@ -19,18 +37,18 @@ def sync_env_files():
     
     try:
         # Copy .env.testnet to .env
-        shutil.copy2(env_testnet, env_file)
+        _copy_file(env_testnet, env_file)
         print(f"✅ Copied {env_testnet} to {env_file}")
         
         # Read and display the INITIAL_BASE_PRICE
-        with open(env_file, 'r') as f:
-            lines = f.readlines()
-        
-        for line in lines:
-            if line.startswith('INITIAL_BASE_PRICE='):
-                base_price = line.strip().split('=')[1]
+        if env_file.stat().st_size > 0:
+            with open(env_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                match = re.search(rb'(?m)^INITIAL_BASE_PRICE=([^=\r\n]*)', mm)
+                # Copy the value out before the mapping is closed
+                base_price = match.group(1).decode().strip() if match else None
+            
+            if base_price is not None:
                 print(f"📊 Base price set to: {base_price} USDT")
-                break
         
         return True
         
@@ -49,24 +67,24 @@ def update_env_value(key: str, value: str):
             
         try:
             # Read current content
-            with open(file_path, 'r') as f:
-                lines = f.readlines()
+            path = Path(file_path)
+            data = path.read_bytes()
             
-            # Update the specific key
-            updated = False
-            for i, line in enumerate(lines):
-                if line.startswith(f'{key}='):
-                    lines[i] = f'{key}={value}\n'
-                    updated = True
-                    break
+            # Update the first line for the key in a single regex pass,
+            # keeping the file's existing line endings
+            newline = b'\r\n' if b'\r\n' in data else b'\n'
+            entry = f'{key}={value}'.encode()
+            pattern = re.compile(rb'(?m)^' + re.escape(key.encode()) + rb'=[^\r\n]*')
+            data, updated = pattern.subn(lambda _: entry, data, count=1)
             
             # Add the key if it doesn't exist
             if not updated:
-                lines.append(f'{key}={value}\n')
+                if data and not data.endswith(b'\n'):
+                    data += newline
+                data += entry + newline
             
             # Write back
-            with open(file_path, 'w') as f:
-                f.writelines(lines)
+            path.write_bytes(data)
             
             print(f"✅ Updated {file_path}: {key}={value}")
             
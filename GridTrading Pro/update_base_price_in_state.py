@@ -3,10 +3,12 @@
 Script to update base price in existing trading state
 """
 
-import json
+import os
 import sys
 from pathlib import Path
 
+import orjson
+
 def update_base_price_in_state(new_base_price: float):
     """Update base price in trading state file"""
     
@@ -18,17 +20,20 @@ def update_base_price_in_state(new_base_price: float):
     
     try:
         # Read current state
-        with open(state_file, 'r') as f:
-            state = json.load(f)
+        state = orjson.loads(state_file.read_bytes())
         
         old_base_price = state.get('base_price', 0)
         
         # Update base price
         state['base_price'] = new_base_price
         
-        # Write back
-        with open(state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        # Write back atomically: a crash mid-write leaves the old file intact
+        tmp_file = state_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, state_file)
         
         print(f"✅ Updated trading state:")
         print(f"   Old base price: {old_base_price:.2f} USDT")